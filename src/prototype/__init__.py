@@ -22,10 +22,32 @@ __codename__ = "waggle"
 __author__ = "SwarmRouter Team"
 __description__ = "Intelligent AI model routing system with local and cloud failover"
 
-# Import main components for easy access
-from .config import Config
-from .router import SwarmRouter
-from .adapters import LMStudioAdapter, OpenRouterAdapter, AzureAdapter
+import importlib
+
+# Main components are resolved on first access (PEP 562) so that importing
+# the package does not pull in aiohttp and every adapter up front.
+_LAZY = {
+    "Config": ".config",
+    "SwarmRouter": ".router",
+    "LMStudioAdapter": ".adapters",
+    "OpenRouterAdapter": ".adapters",
+    "AzureAdapter": ".adapters",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 __all__ = [
     "Config",
@@ -13,6 +13,15 @@ MVP Architecture:
 Each adapter normalizes provider APIs to a common OpenAI-compatible interface
 for seamless routing and failover between providers.
 
+For many independent requests, use ``adapter.batch_chat_completion(requests)``
+rather than a serial loop; a concurrency of 2-8 keeps the provider busy
+without tripping its rate limits.
+
+Choosing the event loop is left to the process entry point: the server gets
+uvloop from uvicorn's ``loop="auto"``, and standalone scripts can call
+``install_fast_loop()`` once before starting their loop. Nothing in this
+module changes the event-loop policy on import or when building adapters.
+
 Stretch Goals (future iterations):
 - Streaming response support
 - Provider-specific optimization (batching, caching)
@@ -24,13 +33,103 @@ Stretch Goals (future iterations):
 import aiohttp
 import asyncio
 import logging
-from typing import Dict, Any, Optional, AsyncGenerator
+from typing import Dict, Any, Iterable, List, Optional, AsyncGenerator, Mapping, Tuple
 from abc import ABC, abstractmethod
 import json
+import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from yarl import URL
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Azure health probe: 429 means the deployment is up but at quota
+_AZURE_HEALTHY_STATUSES = frozenset({200, 429})
+
+# Responses worth retrying: rate limited or a transient gateway failure
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+class ProviderError(Exception):
+    """Raised when a provider request fails."""
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class RateLimitError(ProviderError):
+    """Raised when a provider rejects a request with HTTP 429."""
+
+
+class AuthenticationError(ProviderError):
+    """Raised when a provider rejects the configured credentials."""
+
+# Connector shared by adapters that do not bring their own (LM Studio).
+# Created lazily because aiohttp connectors must be built inside a running loop.
+_DEFAULT_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+
+
+def _get_default_connector() -> aiohttp.TCPConnector:
+    """Return the shared keep-alive connector, creating it on first use."""
+    global _DEFAULT_CONNECTOR
+    if _DEFAULT_CONNECTOR is None or _DEFAULT_CONNECTOR.closed:
+        _DEFAULT_CONNECTOR = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+    return _DEFAULT_CONNECTOR
+
+
+# Sessions shared by every adapter talking to the same (scheme, host, port,
+# timeout), with the number of adapters holding each one.
+_SESSIONS: Dict[tuple, aiohttp.ClientSession] = {}
+_SESSION_REFS: Dict[tuple, int] = {}
+
+
+async def close_shared_sessions():
+    """Close every registry session regardless of remaining references."""
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    _SESSION_REFS.clear()
+    await asyncio.gather(*(s.close() for s in sessions if not s.closed), return_exceptions=True)
+
+
+async def close_default_connector():
+    """Close the shared connector (call once at application shutdown)."""
+    global _DEFAULT_CONNECTOR
+    if _DEFAULT_CONNECTOR is not None and not _DEFAULT_CONNECTOR.closed:
+        await _DEFAULT_CONNECTOR.close()
+    _DEFAULT_CONNECTOR = None
+
 
 class ProviderAdapter(ABC):
     """
@@ -40,27 +139,161 @@ class ProviderAdapter(ABC):
     for consistent routing behavior across different providers.
     """
     
-    def __init__(self, timeout: int = 60):
+    # Instance attributes live in slots; subclasses declare their own additions.
+    # Class-level settings below are overridden by subclassing, not per instance.
+    __slots__ = (
+        "timeout", "backend", "max_concurrency", "max_retries", "retry_delay", "session",
+        "_client", "_session_key", "_sem", "_session_lock", "_health_cache", "_health_lock"
+    )
+    
+    # Display name used in log and error messages
+    PROVIDER_NAME = "Provider"
+    
+    # How long a health result is reused before probing the provider again
+    HEALTH_TTL_SECONDS = 10.0
+    
+    # True when health_check() spends quota, so it must not be run on a timer
+    BILLABLE_HEALTH_CHECK = False
+    
+    # True when submit_batch()/get_batch() are implemented; check before calling
+    SUPPORTS_BATCH = False
+    
+    # Retry policy for rate-limited or transiently failing requests; the
+    # first two are defaults for the max_retries/retry_delay arguments
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 10.0
+    
+    def __init__(self, timeout: int = 60, max_concurrency: int = 8, backend: str = "aiohttp",
+                 max_retries: Optional[int] = None, retry_delay: Optional[float] = None):
         """
         Initialize the adapter with common configuration.
         
         Args:
             timeout: Request timeout in seconds
+            max_concurrency: Maximum chat completions in flight at once
+            backend: HTTP client for chat completions ("aiohttp" or "httpx")
+            max_retries: Retries for 429/502/503/504 (default MAX_RETRIES)
+            retry_delay: Base backoff delay in seconds (default RETRY_BASE_DELAY)
         """
+        if backend not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unsupported HTTP backend: {backend}")
+        if backend == "httpx" and not HAS_HTTPX:
+            raise ValueError("The httpx backend requires the 'httpx' package")
         self.timeout = timeout
+        self.backend = backend
+        self._client = None  # httpx.AsyncClient when backend == "httpx"
+        self.max_concurrency = max_concurrency
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self.retry_delay = self.RETRY_BASE_DELAY if retry_delay is None else retry_delay
+        self._sem = asyncio.Semaphore(max_concurrency)
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_key: Optional[tuple] = None
+        self._session_lock = asyncio.Lock()
+        self._health_cache: Optional[Tuple[float, bool]] = None
+        self._health_lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _create_connector(self) -> Tuple[aiohttp.TCPConnector, bool]:
+        """
+        Return the connector for a new session and whether the session owns it.
+        
+        By default sessions borrow the module-wide connector so keep-alive
+        connections and the DNS cache survive across adapters.
+        """
+        return _get_default_connector(), False
+    
+    def _host_url(self) -> Optional[URL]:
+        """Provider URL whose scheme/host/port selects the shared session."""
+        return None
     
     async def _ensure_session(self):
-        """Ensure aiohttp session is initialized."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            )
+        """
+        Ensure aiohttp session is initialized.
+        
+        Adapters targeting the same scheme, host, port and timeout share one
+        registry session (e.g. several OpenRouter adapters with different
+        keys), so keep-alive connections and the DNS cache are pooled across
+        them. The lock is only taken when no usable session exists, so
+        concurrent first calls attach exactly once and the steady state is a
+        single attribute check.
+        """
+        if self.session is not None and not self.session.closed:
+            return
+        async with self._session_lock:
+            if self.session is not None and not self.session.closed:
+                return
+            self._release_session()
+            url = self._host_url()
+            key = (url.scheme, url.host, url.port, self.timeout) if url is not None else (id(self), self.timeout)
+            session = _SESSIONS.get(key)
+            if session is None or session.closed:
+                connector, owner = self._create_connector()
+                session = aiohttp.ClientSession(
+                    connector=connector,
+                    connector_owner=owner,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                )
+                _SESSIONS[key] = session
+                _SESSION_REFS[key] = 0
+            _SESSION_REFS[key] += 1
+            self._session_key = key
+            self.session = session
+    
+    def _release_session(self) -> Optional[aiohttp.ClientSession]:
+        """
+        Drop this adapter's reference to its registry session.
+        
+        Returns:
+            The session if this was the last reference and it should be closed
+        """
+        key, session = self._session_key, self.session
+        self._session_key = None
+        self.session = None
+        if key is None or _SESSIONS.get(key) is not session:
+            return None
+        _SESSION_REFS[key] -= 1
+        if _SESSION_REFS[key] > 0:
+            return None
+        del _SESSIONS[key]
+        del _SESSION_REFS[key]
+        return session
+    
+    async def _ensure_client(self):
+        """
+        Ensure the httpx client is initialized.
+        
+        One client per adapter; with h2 installed it negotiates HTTP/2 so
+        concurrent requests multiplex over a single TLS connection.
+        """
+        if self._client is not None and not self._client.is_closed:
+            return
+        async with self._session_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.AsyncClient(
+                    http2=HAS_H2,
+                    limits=httpx.Limits(max_connections=256, max_keepalive_connections=256),
+                    timeout=self.timeout
+                )
     
     async def close(self):
-        """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """
+        Clean up resources.
+        
+        The shared session (and any connector it owns) is closed only when
+        the last adapter using it closes.
+        """
+        session = self._release_session()
+        if session is not None and not session.closed:
+            await session.close()
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
     
     @abstractmethod
     async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -74,15 +307,272 @@ class ProviderAdapter(ABC):
             OpenAI-format chat completion response
             
         Raises:
-            Exception: If the request fails
+            ProviderError: If the request fails
         """
         pass
     
+    def _warmup_url(self) -> Optional[URL]:
+        """URL on the provider host used to pre-open connections (None to skip)."""
+        return None
+    
+    async def warmup(self, n: int = 2):
+        """
+        Pre-open keep-alive connections to the provider host.
+        
+        Sends ``n`` concurrent HEAD requests so the TCP and TLS handshakes
+        happen now rather than on the first real request. The response
+        status does not matter; failures are logged and ignored.
+        """
+        url = self._warmup_url()
+        if url is None:
+            return
+        
+        if self.backend == "httpx":
+            await self._ensure_client()
+        else:
+            await self._ensure_session()
+        
+        async def touch():
+            try:
+                if self.backend == "httpx":
+                    await self._client.head(str(url))
+                else:
+                    async with self.session.head(url) as response:
+                        await response.read()
+            except Exception as e:
+                logger.debug("%s warmup request failed: %s", self.PROVIDER_NAME, e)
+        
+        await asyncio.gather(*(touch() for _ in range(n)))
+    
+    async def batch_chat_completion(self, requests: List[Dict[str, Any]], concurrency: int = 8) -> List[Any]:
+        """
+        Run several chat completions concurrently.
+        
+        Args:
+            requests: OpenAI-format chat completion requests
+            concurrency: Maximum requests from this batch in flight at once
+            
+        Returns:
+            Responses in request order; a failed request's slot holds its exception
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def one(request_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.chat_completion(request_data)
+        
+        return await asyncio.gather(*(one(r) for r in requests), return_exceptions=True)
+    
+    async def submit_batch(self, lines: Iterable[Dict[str, Any]]) -> str:
+        """
+        Submit chat completion requests to the provider's asynchronous batch API.
+        
+        Batch jobs trade latency (hours) for lower cost and separate rate
+        limits, which suits evaluation and enrichment workloads. Only
+        adapters with SUPPORTS_BATCH set implement it.
+        
+        Args:
+            lines: OpenAI-format chat completion requests; an optional
+                "custom_id" key identifies each one in the results
+            
+        Returns:
+            Provider batch ID
+            
+        Raises:
+            NotImplementedError: If SUPPORTS_BATCH is False
+        """
+        raise NotImplementedError(f"{self.PROVIDER_NAME} does not offer a batch API")
+    
+    async def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the status of a submitted batch.
+        
+        Returns:
+            Provider batch object, or None if the batch is unknown
+            
+        Raises:
+            NotImplementedError: If SUPPORTS_BATCH is False
+        """
+        raise NotImplementedError(f"{self.PROVIDER_NAME} does not offer a batch API")
+    
     @abstractmethod
+    def _prepare_chat_request(self, request_data: Dict[str, Any]) -> Tuple[URL, Mapping[str, str], Dict[str, Any]]:
+        """
+        Translate an OpenAI-format request into this provider's call.
+        
+        Returns:
+            (url, headers, body) for the chat completions POST
+        """
+        pass
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (0-based).
+        
+        Honors a Retry-After header in either delta-seconds or HTTP-date form,
+        otherwise backs off exponentially. A little jitter keeps concurrent
+        callers from retrying in lockstep.
+        """
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+        if delay is None:
+            delay = self.retry_delay * (2 ** attempt)
+        delay = min(max(delay, 0.0), self.RETRY_MAX_DELAY)
+        return delay + random.uniform(0, self.retry_delay / 2)
+    
+    async def _post_json(self, url: URL, body: Dict[str, Any], headers: Mapping[str, str]) -> Dict[str, Any]:
+        """
+        POST a JSON body and return the decoded JSON response.
+        
+        429 and 502/503/504 responses are retried up to max_retries times.
+        The concurrency slot is released while waiting.
+        
+        Raises:
+            RateLimitError: On HTTP 429
+            AuthenticationError: On HTTP 401
+            ProviderError: On any other failure, timeout or connection error
+        """
+        name = self.PROVIDER_NAME
+        data = _json_dumps(body)
+        send = self._send_httpx if self.backend == "httpx" else self._send_aiohttp
+        
+        for attempt in range(self.max_retries + 1):
+            async with self._sem:
+                status, response_headers, content = await send(url, data, headers)
+            
+            if status == 200:
+                result = _json_loads(content)
+                logger.debug("%s request successful", name)
+                self._mark_healthy()
+                return result
+            elif status in _RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._retry_delay(attempt, response_headers.get("Retry-After"))
+                logger.warning("%s returned %d, retrying in %.2fs", name, status, delay)
+                await asyncio.sleep(delay)
+            elif status == 429:
+                logger.warning("%s rate limit exceeded", name)
+                raise RateLimitError(f"{name} rate limit exceeded", status)
+            elif status == 401:
+                logger.error("%s authentication failed", name)
+                raise AuthenticationError(f"{name} authentication failed", status)
+            else:
+                error_text = content.decode("utf-8", errors="replace")
+                logger.error("%s error %d: %s", name, status, error_text)
+                raise ProviderError(f"{name} API error: {status} - {error_text}", status)
+    
+    async def _send_aiohttp(self, url: URL, data: bytes, headers: Mapping[str, str]) -> Tuple[int, Mapping[str, str], bytes]:
+        """POST via the aiohttp session; returns (status, headers, body)."""
+        await self._ensure_session()
+        name = self.PROVIDER_NAME
+        try:
+            async with self.session.post(url, data=data, headers=headers) as response:
+                return response.status, response.headers, await response.read()
+        except asyncio.TimeoutError:
+            logger.error("%s request timeout", name)
+            raise ProviderError(f"{name} request timeout")
+        except aiohttp.ClientError as e:
+            logger.error("%s connection error: %s", name, e)
+            raise ProviderError(f"{name} connection error: {str(e)}")
+    
+    async def _send_httpx(self, url: URL, data: bytes, headers: Mapping[str, str]) -> Tuple[int, Mapping[str, str], bytes]:
+        """POST via the httpx client; returns (status, headers, body)."""
+        await self._ensure_client()
+        name = self.PROVIDER_NAME
+        try:
+            response = await self._client.post(str(url), content=data, headers=headers)
+            return response.status_code, response.headers, response.content
+        except httpx.TimeoutException:
+            logger.error("%s request timeout", name)
+            raise ProviderError(f"{name} request timeout")
+        except httpx.HTTPError as e:
+            logger.error("%s connection error: %s", name, e)
+            raise ProviderError(f"{name} connection error: {str(e)}")
+    
+    async def chat_completion_stream(self, request_data: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream a chat completion as server-sent events.
+        
+        Sends the request with ``stream: true`` and yields each decoded
+        ``data:`` chunk as it arrives, so callers can forward tokens before
+        the full completion is generated.
+        
+        Args:
+            request_data: OpenAI-format chat completion request
+            
+        Yields:
+            OpenAI-format chat completion chunks
+        """
+        url, headers, body = self._prepare_chat_request(request_data)
+        body["stream"] = True
+        await self._ensure_session()
+        
+        try:
+            async with self._sem:
+                async with self.session.post(
+                    url,
+                    data=_json_dumps(body),
+                    headers=headers
+                ) as response:
+                    
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error("%s stream error %d: %s", self.PROVIDER_NAME, response.status, error_text)
+                        raise ProviderError(f"{self.PROVIDER_NAME} API error: {response.status} - {error_text}", response.status)
+                    
+                    self._mark_healthy()
+                    async for line in response.content:
+                        line = line.strip()
+                        if not line.startswith(b"data:"):
+                            continue  # blank separators, comments and keep-alives
+                        data = line[5:].strip()
+                        if data == b"[DONE]":
+                            break
+                        yield _json_loads(data)
+                        
+        except asyncio.TimeoutError:
+            logger.error("%s stream timeout", self.PROVIDER_NAME)
+            raise ProviderError(f"{self.PROVIDER_NAME} request timeout")
+        except aiohttp.ClientError as e:
+            logger.error("%s stream connection error: %s", self.PROVIDER_NAME, e)
+            raise ProviderError(f"{self.PROVIDER_NAME} connection error: {str(e)}")
+    
     async def health_check(self) -> bool:
         """
         Check if the provider is healthy and available.
         
+        Results are cached for HEALTH_TTL_SECONDS, and concurrent callers
+        share a single in-flight probe.
+        
+        Returns:
+            True if provider is healthy, False otherwise
+        """
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < self.HEALTH_TTL_SECONDS:
+            return cached[1]
+        async with self._health_lock:
+            cached = self._health_cache
+            if cached is not None and time.monotonic() - cached[0] < self.HEALTH_TTL_SECONDS:
+                return cached[1]
+            is_healthy = await self._probe_health()
+            self._health_cache = (time.monotonic(), is_healthy)
+            return is_healthy
+    
+    def _mark_healthy(self):
+        """Record a successful real request so the next health check can skip its probe."""
+        self._health_cache = (time.monotonic(), True)
+    
+    @abstractmethod
+    async def _probe_health(self) -> bool:
+        """
+        Perform a live health probe against the provider.
+        
         Returns:
             True if provider is healthy, False otherwise
         """
@@ -107,18 +597,37 @@ class LMStudioAdapter(ProviderAdapter):
     - Performance optimization for local inference
     """
     
-    def __init__(self, base_url: str = "http://localhost:1234", timeout: int = 30):
+    __slots__ = ("base_url", "chat_url", "models_url")
+    
+    PROVIDER_NAME = "LM Studio"
+    
+    def __init__(self, base_url: str = "http://localhost:1234", timeout: int = 30, max_concurrency: int = 16,
+                 max_retries: Optional[int] = None, retry_delay: Optional[float] = None):
         """
         Initialize LM Studio adapter.
         
         Args:
             base_url: LM Studio server URL
             timeout: Request timeout in seconds
+            max_concurrency: Maximum chat completions in flight at once
+            max_retries: Retries for 429/502/503/504 (default MAX_RETRIES)
+            retry_delay: Base backoff delay in seconds (default RETRY_BASE_DELAY)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, max_concurrency, max_retries=max_retries, retry_delay=retry_delay)
         self.base_url = base_url.rstrip('/')
-        self.chat_url = f"{self.base_url}/v1/chat/completions"
-        self.models_url = f"{self.base_url}/v1/models"
+        # Parsed once here; aiohttp uses URL objects as-is instead of re-parsing
+        self.chat_url = URL(f"{self.base_url}/v1/chat/completions")
+        self.models_url = URL(f"{self.base_url}/v1/models")
+    
+    def _host_url(self) -> Optional[URL]:
+        return self.chat_url
+    
+    def _warmup_url(self) -> Optional[URL]:
+        return self.models_url
+    
+    def _prepare_chat_request(self, request_data: Dict[str, Any]) -> Tuple[URL, Mapping[str, str], Dict[str, Any]]:
+        """LM Studio takes the OpenAI request unchanged."""
+        return self.chat_url, _JSON_HEADERS, dict(request_data)
     
     async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -127,34 +636,11 @@ class LMStudioAdapter(ProviderAdapter):
         LM Studio uses OpenAI-compatible format, so we can forward requests directly
         with minimal transformation.
         """
-        await self._ensure_session()
-        
-        try:
-            logger.debug(f"Sending request to LM Studio: {self.chat_url}")
-            
-            async with self.session.post(
-                self.chat_url,
-                json=request_data,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                
-                if response.status == 200:
-                    result = await response.json()
-                    logger.debug("LM Studio request successful")
-                    return result
-                else:
-                    error_text = await response.text()
-                    logger.error(f"LM Studio error {response.status}: {error_text}")
-                    raise Exception(f"LM Studio API error: {response.status} - {error_text}")
-                    
-        except asyncio.TimeoutError:
-            logger.error("LM Studio request timeout")
-            raise Exception("LM Studio request timeout")
-        except aiohttp.ClientError as e:
-            logger.error(f"LM Studio connection error: {str(e)}")
-            raise Exception(f"LM Studio connection error: {str(e)}")
+        url, headers, body = self._prepare_chat_request(request_data)
+        logger.debug("Sending request to LM Studio: %s", url)
+        return await self._post_json(url, body, headers)
     
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         """
         Check LM Studio server health by querying available models.
         
@@ -166,18 +652,19 @@ class LMStudioAdapter(ProviderAdapter):
         try:
             async with self.session.get(self.models_url) as response:
                 if response.status == 200:
-                    models_data = await response.json()
+                    models_data = _json_loads(await response.read())
                     # Check if any models are available
                     models = models_data.get("data", [])
                     is_healthy = len(models) > 0
-                    logger.debug(f"LM Studio health check: {'healthy' if is_healthy else 'no models'} ({len(models)} models)")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("LM Studio health check: %s (%d models)", "healthy" if is_healthy else "no models", len(models))
                     return is_healthy
                 else:
-                    logger.warning(f"LM Studio health check failed: {response.status}")
+                    logger.warning("LM Studio health check failed: %d", response.status)
                     return False
                     
         except Exception as e:
-            logger.warning(f"LM Studio health check error: {str(e)}")
+            logger.warning("LM Studio health check error: %s", e)
             return False
 
 
@@ -199,7 +686,12 @@ class OpenRouterAdapter(ProviderAdapter):
     - Advanced routing based on model capabilities
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://openrouter.ai/api/v1", timeout: int = 60):
+    __slots__ = ("api_key", "base_url", "chat_url", "models_url", "_headers")
+    
+    PROVIDER_NAME = "OpenRouter"
+    
+    def __init__(self, api_key: str, base_url: str = "https://openrouter.ai/api/v1", timeout: int = 60, max_concurrency: int = 8,
+                 backend: str = "aiohttp", max_retries: Optional[int] = None, retry_delay: Optional[float] = None):
         """
         Initialize OpenRouter adapter.
         
@@ -207,21 +699,50 @@ class OpenRouterAdapter(ProviderAdapter):
             api_key: OpenRouter API key
             base_url: OpenRouter API base URL
             timeout: Request timeout in seconds
+            max_concurrency: Maximum chat completions in flight at once
+            backend: HTTP client for chat completions ("aiohttp" or "httpx")
+            max_retries: Retries for 429/502/503/504 (default MAX_RETRIES)
+            retry_delay: Base backoff delay in seconds (default RETRY_BASE_DELAY)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, max_concurrency, backend, max_retries, retry_delay)
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
-        self.chat_url = f"{self.base_url}/chat/completions"
-        self.models_url = f"{self.base_url}/models"
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers for OpenRouter requests."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
+        self.chat_url = URL(f"{self.base_url}/chat/completions")
+        self.models_url = URL(f"{self.base_url}/models")
+        # Credentials are fixed for the adapter's lifetime, so build the
+        # header mapping once instead of on every request.
+        self._headers = MappingProxyType({
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/norrisaftcc/tool-swarmrouter",  # Required by OpenRouter
             "X-Title": "SwarmRouter (Waggle)"  # Optional but helpful for tracking
-        }
+        })
+    
+    def _create_connector(self) -> Tuple[aiohttp.TCPConnector, bool]:
+        """Use a dedicated connector so this host keeps its own TLS connections."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=128,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        return connector, True
+    
+    def _get_headers(self) -> Mapping[str, str]:
+        """Get HTTP headers for OpenRouter requests."""
+        return self._headers
+    
+    def _host_url(self) -> Optional[URL]:
+        return self.chat_url
+    
+    def _warmup_url(self) -> Optional[URL]:
+        return self.models_url
+    
+    def _prepare_chat_request(self, request_data: Dict[str, Any]) -> Tuple[URL, Mapping[str, str], Dict[str, Any]]:
+        """Fill in the default model, which OpenRouter requires."""
+        body = dict(request_data)
+        body.setdefault("model", "openai/gpt-3.5-turbo")
+        return self.chat_url, self._headers, body
     
     async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -230,46 +751,11 @@ class OpenRouterAdapter(ProviderAdapter):
         OpenRouter uses OpenAI-compatible format with additional features
         like model selection and routing preferences.
         """
-        await self._ensure_session()
-        
-        try:
-            # Ensure we have a model specified (OpenRouter requires this)
-            if "model" not in request_data:
-                request_data["model"] = "openai/gpt-3.5-turbo"  # Default fallback
-            
-            logger.debug(f"Sending request to OpenRouter: {request_data.get('model', 'unknown')}")
-            
-            async with self.session.post(
-                self.chat_url,
-                json=request_data,
-                headers=self._get_headers()
-            ) as response:
-                
-                if response.status == 200:
-                    result = await response.json()
-                    logger.debug("OpenRouter request successful")
-                    return result
-                elif response.status == 429:
-                    # Rate limit exceeded
-                    logger.warning("OpenRouter rate limit exceeded")
-                    raise Exception("OpenRouter rate limit exceeded")
-                elif response.status == 401:
-                    # Authentication error
-                    logger.error("OpenRouter authentication failed")
-                    raise Exception("OpenRouter authentication failed")
-                else:
-                    error_text = await response.text()
-                    logger.error(f"OpenRouter error {response.status}: {error_text}")
-                    raise Exception(f"OpenRouter API error: {response.status} - {error_text}")
-                    
-        except asyncio.TimeoutError:
-            logger.error("OpenRouter request timeout")
-            raise Exception("OpenRouter request timeout")
-        except aiohttp.ClientError as e:
-            logger.error(f"OpenRouter connection error: {str(e)}")
-            raise Exception(f"OpenRouter connection error: {str(e)}")
+        url, headers, body = self._prepare_chat_request(request_data)
+        logger.debug("Sending request to OpenRouter: %s", body['model'])
+        return await self._post_json(url, body, headers)
     
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         """
         Check OpenRouter service health by querying available models.
         
@@ -285,21 +771,22 @@ class OpenRouterAdapter(ProviderAdapter):
             ) as response:
                 
                 if response.status == 200:
-                    models_data = await response.json()
+                    models_data = _json_loads(await response.read())
                     # Check if models are available
                     models = models_data.get("data", [])
                     is_healthy = len(models) > 0
-                    logger.debug(f"OpenRouter health check: {'healthy' if is_healthy else 'no models'} ({len(models)} models)")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("OpenRouter health check: %s (%d models)", "healthy" if is_healthy else "no models", len(models))
                     return is_healthy
                 elif response.status == 401:
                     logger.warning("OpenRouter health check: authentication failed")
                     return False
                 else:
-                    logger.warning(f"OpenRouter health check failed: {response.status}")
+                    logger.warning("OpenRouter health check failed: %d", response.status)
                     return False
                     
         except Exception as e:
-            logger.warning(f"OpenRouter health check error: {str(e)}")
+            logger.warning("OpenRouter health check error: %s", e)
             return False
 
 
@@ -321,7 +808,28 @@ class AzureAdapter(ProviderAdapter):
     - Multi-region deployment support
     """
     
-    def __init__(self, endpoint: str, api_key: str, api_version: str = "2023-12-01-preview", timeout: int = 60):
+    __slots__ = (
+        "endpoint", "api_key", "api_version", "default_deployment", "_headers",
+        "_openai_url", "_deployments_url", "_url_cache"
+    )
+    
+    PROVIDER_NAME = "Azure OpenAI"
+    
+    # The probe is a real (1-token) chat completion
+    BILLABLE_HEALTH_CHECK = True
+    
+    SUPPORTS_BATCH = True
+    
+    # Simple model name to deployment mapping
+    DEPLOYMENT_MAP = MappingProxyType({
+        "gpt-3.5-turbo": "gpt-35-turbo",
+        "gpt-4": "gpt-4",
+        "gpt-4-turbo": "gpt-4-turbo",
+        "gpt-4o": "gpt-4o"
+    })
+    
+    def __init__(self, endpoint: str, api_key: str, api_version: str = "2023-12-01-preview", timeout: int = 60, max_concurrency: int = 4,
+                 backend: str = "aiohttp", max_retries: Optional[int] = None, retry_delay: Optional[float] = None):
         """
         Initialize Azure OpenAI adapter.
         
@@ -330,8 +838,12 @@ class AzureAdapter(ProviderAdapter):
             api_key: Azure OpenAI API key
             api_version: Azure OpenAI API version
             timeout: Request timeout in seconds
+            max_concurrency: Maximum chat completions in flight at once
+            backend: HTTP client for chat completions ("aiohttp" or "httpx")
+            max_retries: Retries for 429/502/503/504 (default MAX_RETRIES)
+            retry_delay: Base backoff delay in seconds (default RETRY_BASE_DELAY)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, max_concurrency, backend, max_retries, retry_delay)
         self.endpoint = endpoint.rstrip('/')
         self.api_key = api_key
         self.api_version = api_version
@@ -339,21 +851,48 @@ class AzureAdapter(ProviderAdapter):
         # Azure uses deployment-specific URLs
         # For MVP, we'll use a default deployment name that can be configured
         self.default_deployment = "gpt-35-turbo"  # Common Azure deployment name
+        self._headers = MappingProxyType({
+            "api-key": api_key,
+            "Content-Type": "application/json"
+        })
+        # Deployment name -> chat URL; endpoint and api_version never change
+        self._openai_url = URL(self.endpoint) / "openai"
+        self._deployments_url = self._openai_url / "deployments"
+        self._url_cache: Dict[str, URL] = {}
+    
+    def _create_connector(self) -> Tuple[aiohttp.TCPConnector, bool]:
+        """Use a dedicated connector so this host keeps its own TLS connections."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=128,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        return connector, True
     
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self) -> Mapping[str, str]:
         """Get HTTP headers for Azure OpenAI requests."""
-        return {
-            "api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
+        return self._headers
     
-    def _get_chat_url(self, deployment_name: str) -> str:
+    def _get_chat_url(self, deployment_name: str) -> URL:
         """
         Get the chat completions URL for a specific deployment.
         
         Azure uses deployment-specific endpoints rather than model names.
         """
-        return f"{self.endpoint}/openai/deployments/{deployment_name}/chat/completions?api-version={self.api_version}"
+        url = self._url_cache.get(deployment_name)
+        if url is None:
+            url = (self._deployments_url / deployment_name / "chat" / "completions").with_query(
+                {"api-version": self.api_version}
+            )
+            self._url_cache[deployment_name] = url
+        return url
+    
+    def _prepare_chat_request(self, request_data: Dict[str, Any]) -> Tuple[URL, Mapping[str, str], Dict[str, Any]]:
+        """Route by deployment URL and drop the model field from the body."""
+        deployment_name = self._extract_deployment_name(request_data.get("model", self.default_deployment))
+        body = {k: v for k, v in request_data.items() if k != "model"}
+        return self._get_chat_url(deployment_name), self._headers, body
     
     async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -362,49 +901,91 @@ class AzureAdapter(ProviderAdapter):
         Azure OpenAI uses a slightly different URL structure with deployments
         instead of model names in the URL path.
         """
-        await self._ensure_session()
+        url, headers, body = self._prepare_chat_request(request_data)
+        logger.debug("Sending request to Azure OpenAI: %s", url)
+        return await self._post_json(url, body, headers)
+    
+    def _host_url(self) -> Optional[URL]:
+        return self._openai_url
+    
+    def _warmup_url(self) -> Optional[URL]:
+        # No models endpoint; any request to the resource host opens the connection
+        return self._openai_url
+    
+    def _api_url(self, *parts: str) -> URL:
+        """Build a versioned URL under the resource's /openai path."""
+        url = self._openai_url
+        for part in parts:
+            url = url / part
+        return url.with_query({"api-version": self.api_version})
+    
+    async def _batch_request(self, method: str, url: URL, headers: Optional[Mapping[str, str]] = None, **kwargs) -> Tuple[int, Dict[str, Any]]:
+        """
+        Send a files/batches API request and return (status, decoded body).
         
+        Only the api-key header is sent by default so multipart uploads can
+        set their own Content-Type.
+        """
+        await self._ensure_session()
         try:
-            # Extract deployment name from model field or use default
-            deployment_name = self._extract_deployment_name(request_data.get("model", self.default_deployment))
-            
-            # Remove model from request data as Azure doesn't expect it in the body
-            azure_request = request_data.copy()
-            if "model" in azure_request:
-                del azure_request["model"]
-            
-            chat_url = self._get_chat_url(deployment_name)
-            logger.debug(f"Sending request to Azure OpenAI: {deployment_name}")
-            
-            async with self.session.post(
-                chat_url,
-                json=azure_request,
-                headers=self._get_headers()
-            ) as response:
-                
-                if response.status == 200:
-                    result = await response.json()
-                    logger.debug("Azure OpenAI request successful")
-                    return result
-                elif response.status == 429:
-                    # Rate limit or quota exceeded
-                    logger.warning("Azure OpenAI rate limit exceeded")
-                    raise Exception("Azure OpenAI rate limit exceeded")
-                elif response.status == 401:
-                    # Authentication error
-                    logger.error("Azure OpenAI authentication failed")
-                    raise Exception("Azure OpenAI authentication failed")
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Azure OpenAI error {response.status}: {error_text}")
-                    raise Exception(f"Azure OpenAI API error: {response.status} - {error_text}")
-                    
+            async with self.session.request(method, url, headers=headers or {"api-key": self.api_key}, **kwargs) as response:
+                content = await response.read()
+                if response.status in (200, 201):
+                    return response.status, _json_loads(content)
+                if response.status == 404:
+                    return response.status, {}
+                error_text = content.decode("utf-8", errors="replace")
+                logger.error("Azure OpenAI batch error %d: %s", response.status, error_text)
+                raise ProviderError(f"Azure OpenAI batch API error: {response.status} - {error_text}", response.status)
         except asyncio.TimeoutError:
-            logger.error("Azure OpenAI request timeout")
-            raise Exception("Azure OpenAI request timeout")
+            raise ProviderError("Azure OpenAI batch request timeout")
         except aiohttp.ClientError as e:
-            logger.error(f"Azure OpenAI connection error: {str(e)}")
-            raise Exception(f"Azure OpenAI connection error: {str(e)}")
+            raise ProviderError(f"Azure OpenAI batch connection error: {str(e)}")
+    
+    async def submit_batch(self, lines: Iterable[Dict[str, Any]]) -> str:
+        """
+        Upload the requests as JSONL and start a 24h Azure OpenAI batch job.
+        
+        Requires a Global Batch deployment and an api_version that exposes the
+        files/batches APIs (2024-07-01-preview or later).
+        """
+        encoded = []
+        for i, request_data in enumerate(lines):
+            body = {k: v for k, v in request_data.items() if k != "custom_id"}
+            body["model"] = self._extract_deployment_name(body.get("model", self.default_deployment))
+            encoded.append(_json_dumps({
+                "custom_id": request_data.get("custom_id", f"request-{i}"),
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": body
+            }))
+        
+        form = aiohttp.FormData()
+        form.add_field("purpose", "batch")
+        form.add_field("file", b"\n".join(encoded), filename="batch.jsonl", content_type="application/jsonl")
+        status, uploaded = await self._batch_request("POST", self._api_url("files"), data=form)
+        if status == 404:
+            raise ProviderError("Azure OpenAI files API not available for this api_version", status)
+        
+        status, batch = await self._batch_request(
+            "POST",
+            self._api_url("batches"),
+            headers=self._headers,
+            data=_json_dumps({
+                "input_file_id": uploaded["id"],
+                "endpoint": "/chat/completions",
+                "completion_window": "24h"
+            })
+        )
+        if status == 404:
+            raise ProviderError("Azure OpenAI batches API not available for this api_version", status)
+        logger.info("Submitted Azure OpenAI batch %s (%d requests)", batch['id'], len(encoded))
+        return batch["id"]
+    
+    async def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Return the Azure OpenAI batch object, or None if it does not exist."""
+        status, batch = await self._batch_request("GET", self._api_url("batches", batch_id))
+        return None if status == 404 else batch
     
     def _extract_deployment_name(self, model_name: str) -> str:
         """
@@ -418,22 +999,16 @@ class AzureAdapter(ProviderAdapter):
         - Dynamic deployment discovery
         - Model-to-deployment mapping configuration
         """
-        # Simple model name to deployment mapping
-        model_mapping = {
-            "gpt-3.5-turbo": "gpt-35-turbo",
-            "gpt-4": "gpt-4",
-            "gpt-4-turbo": "gpt-4-turbo",
-            "gpt-4o": "gpt-4o"
-        }
-        
-        return model_mapping.get(model_name, self.default_deployment)
+        return self.DEPLOYMENT_MAP.get(model_name, self.default_deployment)
     
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         """
         Check Azure OpenAI service health.
         
         Since Azure doesn't have a models endpoint, we'll do a minimal
-        test request to check connectivity and authentication.
+        test request to check connectivity and authentication. The probe
+        spends quota, so successful chat completions refresh the cached
+        health and it only runs when the adapter has been idle.
         """
         await self._ensure_session()
         
@@ -448,29 +1023,115 @@ class AzureAdapter(ProviderAdapter):
             
             async with self.session.post(
                 chat_url,
-                json=test_request,
+                data=_json_dumps(test_request),
                 headers=self._get_headers()
             ) as response:
                 
                 # Accept both success and quota exceeded as "healthy"
                 # (quota exceeded means the service is working, just at capacity)
-                is_healthy = response.status in [200, 429]
-                logger.debug(f"Azure OpenAI health check: {'healthy' if is_healthy else 'unhealthy'} (status: {response.status})")
+                is_healthy = response.status in _AZURE_HEALTHY_STATUSES
+                logger.debug("Azure OpenAI health check: %s (status: %d)", "healthy" if is_healthy else "unhealthy", response.status)
                 return is_healthy
                     
         except Exception as e:
-            logger.warning(f"Azure OpenAI health check error: {str(e)}")
+            logger.warning("Azure OpenAI health check error: %s", e)
             return False
 
 
+_loop_installed = False
+
+
+def install_fast_loop() -> bool:
+    """
+    Use uvloop for new asyncio event loops if it is installed.
+    
+    This changes the process-wide event-loop policy, so only entry points
+    (scripts, ``__main__`` blocks) should call it, before creating a loop.
+    
+    Returns:
+        True if uvloop's event loop policy is in effect
+    """
+    global _loop_installed
+    if not _loop_installed:
+        _loop_installed = True
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not installed; using the default asyncio loop")
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return type(asyncio.get_event_loop_policy()).__module__.startswith("uvloop")
+
+
+# Builders for create_adapter, keyed by lower-cased provider type
+def _build_lmstudio(**config) -> ProviderAdapter:
+    return LMStudioAdapter(
+        base_url=config.get("base_url", "http://localhost:1234"),
+        timeout=config.get("timeout", 30),
+        max_concurrency=config.get("max_concurrency", 16),
+        max_retries=config.get("max_retries"),
+        retry_delay=config.get("retry_delay")
+    )
+
+
+def _build_openrouter(**config) -> ProviderAdapter:
+    if "api_key" not in config:
+        raise ValueError("OpenRouter adapter requires 'api_key' parameter")
+    
+    return OpenRouterAdapter(
+        api_key=config["api_key"],
+        base_url=config.get("base_url", "https://openrouter.ai/api/v1"),
+        timeout=config.get("timeout", 60),
+        max_concurrency=config.get("max_concurrency", 8),
+        backend=config.get("backend", "aiohttp"),
+        max_retries=config.get("max_retries"),
+        retry_delay=config.get("retry_delay")
+    )
+
+
+def _build_azure(**config) -> ProviderAdapter:
+    if "endpoint" not in config or "api_key" not in config:
+        raise ValueError("Azure adapter requires 'endpoint' and 'api_key' parameters")
+    
+    return AzureAdapter(
+        endpoint=config["endpoint"],
+        api_key=config["api_key"],
+        api_version=config.get("api_version", "2023-12-01-preview"),
+        timeout=config.get("timeout", 60),
+        max_concurrency=config.get("max_concurrency", 4),
+        backend=config.get("backend", "aiohttp"),
+        max_retries=config.get("max_retries"),
+        retry_delay=config.get("retry_delay")
+    )
+
+
+# Strong references to fire-and-forget warmup tasks until they finish
+_BACKGROUND_TASKS = set()
+
+_BUILDERS = MappingProxyType({
+    "lmstudio": _build_lmstudio,
+    "openrouter": _build_openrouter,
+    "azure": _build_azure
+})
+
+
 # Factory function for creating adapters
 def create_adapter(provider_type: str, **config) -> ProviderAdapter:
     """
     Factory function to create provider adapters.
     
+    Adapters are async context managers, so short-lived callers should use
+    ``async with create_adapter(...) as adapter:`` to guarantee the session
+    is closed.
+    
     Args:
         provider_type: Type of provider ("lmstudio", "openrouter", "azure")
-        **config: Provider-specific configuration parameters
+        **config: Provider-specific configuration parameters. OpenRouter and
+            Azure accept backend="httpx" to send chat completions over
+            httpx (HTTP/2 when the h2 package is installed). warmup=True
+            pre-opens connections in the background when called from a
+            running event loop. max_retries and retry_delay override the
+            adapter's default retry policy.
         
     Returns:
         Configured provider adapter instance
@@ -478,47 +1139,36 @@ def create_adapter(provider_type: str, **config) -> ProviderAdapter:
     Raises:
         ValueError: If provider type is not supported
     """
-    if provider_type.lower() == "lmstudio":
-        return LMStudioAdapter(
-            base_url=config.get("base_url", "http://localhost:1234"),
-            timeout=config.get("timeout", 30)
-        )
-    
-    elif provider_type.lower() == "openrouter":
-        if "api_key" not in config:
-            raise ValueError("OpenRouter adapter requires 'api_key' parameter")
-        
-        return OpenRouterAdapter(
-            api_key=config["api_key"],
-            base_url=config.get("base_url", "https://openrouter.ai/api/v1"),
-            timeout=config.get("timeout", 60)
-        )
-    
-    elif provider_type.lower() == "azure":
-        if "endpoint" not in config or "api_key" not in config:
-            raise ValueError("Azure adapter requires 'endpoint' and 'api_key' parameters")
-        
-        return AzureAdapter(
-            endpoint=config["endpoint"],
-            api_key=config["api_key"],
-            api_version=config.get("api_version", "2023-12-01-preview"),
-            timeout=config.get("timeout", 60)
-        )
+    warmup = config.pop("warmup", False)
+    try:
+        builder = _BUILDERS[provider_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported provider type: {provider_type}") from None
+    adapter = builder(**config)
     
-    else:
-        raise ValueError(f"Unsupported provider type: {provider_type}")
+    if warmup:
+        # Only possible from inside a running loop; otherwise call warmup() later
+        try:
+            task = asyncio.get_running_loop().create_task(adapter.warmup())
+        except RuntimeError:
+            logger.debug("No running event loop; skipping warmup for %s", adapter.PROVIDER_NAME)
+        else:
+            _BACKGROUND_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return adapter
 
 
 # Cleanup utility for graceful shutdown
 async def cleanup_adapters(*adapters: ProviderAdapter):
     """
-    Clean up multiple adapter instances.
+    Clean up multiple adapter instances, the session registry and the shared connector.
     
     Args:
         *adapters: Variable number of adapter instances to clean up
     """
-    for adapter in adapters:
-        try:
-            await adapter.close()
-        except Exception as e:
-            logger.warning(f"Error cleaning up adapter: {str(e)}")
\ No newline at end of file
+    results = await asyncio.gather(*(adapter.close() for adapter in adapters), return_exceptions=True)
+    for adapter, result in zip(adapters, results):
+        if isinstance(result, Exception):
+            logger.warning("Error cleaning up %s: %s", type(adapter).__name__, result)
+    await close_shared_sessions()
+    await close_default_connector()
\ No newline at end of file
@@ -18,13 +18,128 @@ Stretch Goals (future iterations):
 
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
+
+try:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import best_match
+    HAS_JSONSCHEMA = True
+except ImportError:
+    HAS_JSONSCHEMA = False
 
 logger = logging.getLogger(__name__)
 
+# Accepted spellings for boolean environment variables (compared lower-cased)
+_TRUE = frozenset({"true", "1", "yes", "on"})
+_FALSE = frozenset({"false", "0", "no", "off"})
+
+# Read-only copy of os.environ taken once, when this module is imported.
+# Later changes to the environment are not seen until refresh_env_snapshot().
+_ENV_SNAPSHOT: Mapping[str, str] = MappingProxyType(dict(os.environ))
+
+
+def refresh_env_snapshot():
+    """Re-copy os.environ into _ENV_SNAPSHOT (for tests that change the environment)."""
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = MappingProxyType(dict(os.environ))
+
+
+# Environment value casters: (raw string, current default) -> parsed value.
+# Numeric casters raise ValueError on bad input; _bool falls back to the default.
+def _bool(value: str, default: bool) -> bool:
+    value = value.lower()
+    if value in _TRUE:
+        return True
+    elif value in _FALSE:
+        return False
+    else:
+        return default
+
+
+def _int(value: str, default: int) -> int:
+    return int(value)
 
-@dataclass
+
+def _float(value: str, default: float) -> float:
+    return float(value)
+
+
+def _str(value: str, default: Optional[str]) -> str:
+    return value
+
+
+_TIMEOUT_SCHEMA = {"type": "integer", "exclusiveMinimum": 0}
+_URL_SCHEMA = {"type": "string", "pattern": "^https?://"}
+
+# Shape of a provider config update, discriminated by provider_type.
+# Every field is optional so partial updates validate; unknown keys are rejected.
+PROVIDER_CONFIG_SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "SwarmRouter provider config update",
+    "oneOf": [
+        {
+            "type": "object",
+            "properties": {
+                "provider_type": {"const": "lmstudio"},
+                "enabled": {"type": "boolean"},
+                "url": _URL_SCHEMA,
+                "timeout": _TIMEOUT_SCHEMA,
+            },
+            "required": ["provider_type"],
+            "additionalProperties": False,
+        },
+        {
+            "type": "object",
+            "properties": {
+                "provider_type": {"const": "openrouter"},
+                "enabled": {"type": "boolean"},
+                "api_key": {"type": "string", "minLength": 1},
+                "base_url": _URL_SCHEMA,
+                "timeout": _TIMEOUT_SCHEMA,
+            },
+            "required": ["provider_type"],
+            "additionalProperties": False,
+        },
+        {
+            "type": "object",
+            "properties": {
+                "provider_type": {"const": "azure"},
+                "enabled": {"type": "boolean"},
+                "endpoint": _URL_SCHEMA,
+                "api_key": {"type": "string", "minLength": 1},
+                "api_version": {"type": "string", "minLength": 1},
+                "timeout": _TIMEOUT_SCHEMA,
+            },
+            "required": ["provider_type"],
+            "additionalProperties": False,
+        },
+    ],
+}
+
+# Compiled once at import; None when jsonschema is not installed
+_VALIDATOR = Draft202012Validator(PROVIDER_CONFIG_SCHEMA) if HAS_JSONSCHEMA else None
+
+# Updates limited to these keys are fully checked by the schema and cannot
+# change which providers are usable, so the cross-field pass is skipped
+_SCHEMA_ONLY_FIELDS = frozenset({"url", "base_url", "timeout"})
+
+
+def _check_provider_schema(provider_type: str, config_updates: Dict[str, Any]):
+    """Raise ValueError naming the offending field if the update fails the schema."""
+    error = best_match(_VALIDATOR.iter_errors({"provider_type": provider_type, **config_updates}))
+    if error is None:
+        return
+    if error.validator == "oneOf":
+        # Report errors from the branch for this provider_type, not the other two
+        mismatched = {e.relative_schema_path[0] for e in error.context if e.validator == "const"}
+        error = best_match(e for e in error.context if e.relative_schema_path[0] not in mismatched) or error
+    path = "/".join(str(part) for part in error.absolute_path) or "<root>"
+    raise ValueError(f"Invalid {provider_type} config at {path}: {error.message}")
+
+
+@dataclass(slots=True)
 class Config:
     """
     Configuration class for SwarmRouter (Waggle) MVP.
@@ -51,6 +166,7 @@ class Config:
     
     # General Configuration
     overflow_timeout: int = 60
+    overflow_backend: str = "aiohttp"  # HTTP client for OpenRouter/Azure completions: "aiohttp" or "httpx"
     max_retries: int = 3
     retry_delay: float = 1.0
     
@@ -62,89 +178,90 @@ class Config:
     # Performance Configuration
     max_concurrent_requests: int = 10
     request_timeout: int = 300
+    health_ttl: float = 2.0  # Seconds /admin/status and get_provider_status() results are reused
+    health_interval: float = 5.0  # Seconds between /health snapshot refreshes (its maximum staleness)
+    health_probe: bool = False  # Also ping UNAVAILABLE providers each refresh (never Azure)
+    hedge_multiplier: float = 0.0  # Hedge after this multiple of a provider's avg latency; 0 disables
     
-    def __init__(self):
+    def __post_init__(self):
         """
-        Initialize configuration from environment variables.
+        Finish initialization from environment variables.
         
         MVP Implementation:
         - Load from environment variables with sensible defaults
         - Basic validation of required fields
         - Log configuration status for debugging
+        
+        Environment variables that are set override the field values,
+        including any passed to the constructor.
         """
         self._load_from_environment()
         self._validate_configuration()
         self._log_configuration_status()
     
-    def _load_from_environment(self):
-        """
-        Load configuration values from environment variables.
-        
-        Environment variable naming convention:
-        - SWARMROUTER_* for general settings
-        - LMSTUDIO_* for local provider settings
-        - OPENROUTER_* for OpenRouter settings
-        - AZURE_* for Azure OpenAI settings
-        """
+    # (environment variable, attribute, caster) for every setting read from the environment
+    _ENV_MAP = (
         # Local Provider (LM Studio) Configuration
-        self.lm_studio_enabled = self._get_bool_env("LMSTUDIO_ENABLED", self.lm_studio_enabled)
-        self.lm_studio_url = os.getenv("LMSTUDIO_URL", self.lm_studio_url)
-        self.local_timeout = self._get_int_env("LMSTUDIO_TIMEOUT", self.local_timeout)
+        ("LMSTUDIO_ENABLED", "lm_studio_enabled", _bool),
+        ("LMSTUDIO_URL", "lm_studio_url", _str),
+        ("LMSTUDIO_TIMEOUT", "local_timeout", _int),
         
         # OpenRouter Configuration
-        self.openrouter_enabled = self._get_bool_env("OPENROUTER_ENABLED", self.openrouter_enabled)
-        self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY", self.openrouter_api_key)
-        self.openrouter_base_url = os.getenv("OPENROUTER_BASE_URL", self.openrouter_base_url)
+        ("OPENROUTER_ENABLED", "openrouter_enabled", _bool),
+        ("OPENROUTER_API_KEY", "openrouter_api_key", _str),
+        ("OPENROUTER_BASE_URL", "openrouter_base_url", _str),
         
         # Azure Configuration
-        self.azure_enabled = self._get_bool_env("AZURE_ENABLED", self.azure_enabled)
-        self.azure_endpoint = os.getenv("AZURE_ENDPOINT", self.azure_endpoint)
-        self.azure_api_key = os.getenv("AZURE_API_KEY", self.azure_api_key)
-        self.azure_api_version = os.getenv("AZURE_API_VERSION", self.azure_api_version)
+        ("AZURE_ENABLED", "azure_enabled", _bool),
+        ("AZURE_ENDPOINT", "azure_endpoint", _str),
+        ("AZURE_API_KEY", "azure_api_key", _str),
+        ("AZURE_API_VERSION", "azure_api_version", _str),
         
         # General Configuration
-        self.overflow_timeout = self._get_int_env("SWARMROUTER_OVERFLOW_TIMEOUT", self.overflow_timeout)
-        self.max_retries = self._get_int_env("SWARMROUTER_MAX_RETRIES", self.max_retries)
-        self.retry_delay = self._get_float_env("SWARMROUTER_RETRY_DELAY", self.retry_delay)
+        ("SWARMROUTER_OVERFLOW_TIMEOUT", "overflow_timeout", _int),
+        ("SWARMROUTER_OVERFLOW_BACKEND", "overflow_backend", _str),
+        ("SWARMROUTER_MAX_RETRIES", "max_retries", _int),
+        ("SWARMROUTER_RETRY_DELAY", "retry_delay", _float),
         
         # Logging Configuration
-        self.log_level = os.getenv("SWARMROUTER_LOG_LEVEL", self.log_level)
-        self.log_requests = self._get_bool_env("SWARMROUTER_LOG_REQUESTS", self.log_requests)
-        self.log_responses = self._get_bool_env("SWARMROUTER_LOG_RESPONSES", self.log_responses)
+        ("SWARMROUTER_LOG_LEVEL", "log_level", _str),
+        ("SWARMROUTER_LOG_REQUESTS", "log_requests", _bool),
+        ("SWARMROUTER_LOG_RESPONSES", "log_responses", _bool),
         
         # Performance Configuration
-        self.max_concurrent_requests = self._get_int_env("SWARMROUTER_MAX_CONCURRENT", self.max_concurrent_requests)
-        self.request_timeout = self._get_int_env("SWARMROUTER_REQUEST_TIMEOUT", self.request_timeout)
+        ("SWARMROUTER_MAX_CONCURRENT", "max_concurrent_requests", _int),
+        ("SWARMROUTER_REQUEST_TIMEOUT", "request_timeout", _int),
+        ("SWARMROUTER_HEALTH_TTL", "health_ttl", _float),
+        ("SWARMROUTER_HEALTH_INTERVAL", "health_interval", _float),
+        ("SWARMROUTER_HEALTH_PROBE", "health_probe", _bool),
+        ("SWARMROUTER_HEDGE_MULTIPLIER", "hedge_multiplier", _float),
+    )
     
-    def _get_bool_env(self, key: str, default: bool) -> bool:
+    def _load_from_environment(self):
         """
-        Get a boolean value from environment variable.
+        Load configuration values from environment variables.
         
-        Accepts: true, false, 1, 0, yes, no (case insensitive)
+        Environment variable naming convention:
+        - SWARMROUTER_* for general settings
+        - LMSTUDIO_* for local provider settings
+        - OPENROUTER_* for OpenRouter settings
+        - AZURE_* for Azure OpenAI settings
+        
+        Values come from the import-time _ENV_SNAPSHOT, not os.environ.
+        Unset variables keep the class default; unparseable numbers are
+        logged and ignored.
         """
-        value = os.getenv(key, "").lower()
-        if value in ["true", "1", "yes", "on"]:
-            return True
-        elif value in ["false", "0", "no", "off"]:
-            return False
-        else:
-            return default
-    
-    def _get_int_env(self, key: str, default: int) -> int:
-        """Get an integer value from environment variable."""
-        try:
-            return int(os.getenv(key, str(default)))
-        except ValueError:
-            logger.warning(f"Invalid integer value for {key}, using default: {default}")
-            return default
-    
-    def _get_float_env(self, key: str, default: float) -> float:
-        """Get a float value from environment variable."""
-        try:
-            return float(os.getenv(key, str(default)))
-        except ValueError:
-            logger.warning(f"Invalid float value for {key}, using default: {default}")
-            return default
+        env = _ENV_SNAPSHOT
+        
+        for key, attr, caster in self._ENV_MAP:
+            value = env.get(key)
+            if value is None:
+                continue
+            default = getattr(self, attr)
+            try:
+                setattr(self, attr, caster(value, default))
+            except ValueError:
+                logger.warning("Invalid %s value for %s, using default: %s", caster.__name__[1:], key, default)
     
     def _validate_configuration(self):
         """
@@ -156,41 +273,49 @@ class Config:
         - Check timeout and retry values are reasonable
         """
         errors = []
-        
-        # Validate that at least one provider is enabled
-        enabled_providers = []
-        
-        if self.lm_studio_enabled:
-            enabled_providers.append("LM Studio")
-            # TODO: Could add URL validation here
-        
-        if self.openrouter_enabled:
-            if not self.openrouter_api_key:
-                errors.append("OpenRouter is enabled but OPENROUTER_API_KEY is not set")
-            else:
-                enabled_providers.append("OpenRouter")
-        
+        self._validate_lmstudio(errors)
+        self._validate_openrouter(errors)
+        self._validate_azure(errors)
+        self._validate_global(errors)
+        self._validate_global_invariants(errors)
+        self._raise_if_invalid(errors)
+        
+        logger.info("Configuration validated successfully. Enabled providers: %s", ", ".join(self._usable_providers()))
+    
+    def _validate_provider(self, provider_type: str):
+        """Validate one provider's settings plus the cross-provider invariants."""
+        errors = []
+        self._VALIDATORS[provider_type](self, errors)
+        self._validate_global_invariants(errors)
+        self._raise_if_invalid(errors)
+    
+    def _validate_lmstudio(self, errors: List[str]):
+        # TODO: Could add URL validation here
+        if self.local_timeout <= 0:
+            errors.append("Local timeout must be positive")
+    
+    def _validate_openrouter(self, errors: List[str]):
+        if self.openrouter_enabled and not self.openrouter_api_key:
+            errors.append("OpenRouter is enabled but OPENROUTER_API_KEY is not set")
+        if self.overflow_timeout <= 0:
+            errors.append("Overflow timeout must be positive")
+    
+    def _validate_azure(self, errors: List[str]):
         if self.azure_enabled:
             if not self.azure_endpoint:
                 errors.append("Azure is enabled but AZURE_ENDPOINT is not set")
             if not self.azure_api_key:
                 errors.append("Azure is enabled but AZURE_API_KEY is not set")
-            if self.azure_endpoint and self.azure_api_key:
-                enabled_providers.append("Azure")
-        
-        if not enabled_providers:
-            errors.append("No providers are properly configured and enabled")
-        
-        # Validate timeout values
-        if self.local_timeout <= 0:
-            errors.append("Local timeout must be positive")
-        
         if self.overflow_timeout <= 0:
             errors.append("Overflow timeout must be positive")
-        
+    
+    def _validate_global(self, errors: List[str]):
         if self.request_timeout <= 0:
             errors.append("Request timeout must be positive")
         
+        if self.overflow_backend not in ("aiohttp", "httpx"):
+            errors.append("Overflow backend must be 'aiohttp' or 'httpx'")
+        
         # Validate retry settings
         if self.max_retries < 0:
             errors.append("Max retries cannot be negative")
@@ -202,25 +327,130 @@ class Config:
         if self.max_concurrent_requests <= 0:
             errors.append("Max concurrent requests must be positive")
         
+        if self.health_ttl < 0:
+            errors.append("Health TTL cannot be negative")
+        
+        if self.health_interval <= 0:
+            errors.append("Health interval must be positive")
+        
+        if self.hedge_multiplier < 0:
+            errors.append("Hedge multiplier cannot be negative")
+    
+    def _validate_global_invariants(self, errors: List[str]):
+        if not self._usable_providers():
+            errors.append("No providers are properly configured and enabled")
+    
+    def _usable_providers(self) -> List[str]:
+        """Names of providers that are enabled and have their required settings."""
+        providers = []
+        if self.lm_studio_enabled:
+            providers.append("LM Studio")
+        if self.openrouter_enabled and self.openrouter_api_key:
+            providers.append("OpenRouter")
+        if self.azure_enabled and self.azure_endpoint and self.azure_api_key:
+            providers.append("Azure")
+        return providers
+    
+    @staticmethod
+    def _raise_if_invalid(errors: List[str]):
         if errors:
+            # The overflow timeout is checked by both overflow providers
+            errors = list(dict.fromkeys(errors))
             error_message = "Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors)
             logger.error(error_message)
             raise ValueError(error_message)
-        
-        logger.info(f"Configuration validated successfully. Enabled providers: {', '.join(enabled_providers)}")
+    
+    # Per-provider validators keyed like _UPDATERS (unbound methods)
+    _VALIDATORS = {
+        "lmstudio": _validate_lmstudio,
+        "openrouter": _validate_openrouter,
+        "azure": _validate_azure,
+    }
     
     def _log_configuration_status(self):
         """
         Log the current configuration status for debugging.
         
-        Note: Sensitive information like API keys are not logged.
+        Note: Sensitive information like API keys are not logged. The full
+        to_dict() view rides along as ``extra={"config": ...}`` for structured
+        handlers. Nothing is built when INFO is disabled.
         """
-        logger.info("SwarmRouter (Waggle) Configuration:")
-        logger.info(f"  LM Studio: {'enabled' if self.lm_studio_enabled else 'disabled'} ({self.lm_studio_url})")
-        logger.info(f"  OpenRouter: {'enabled' if self.openrouter_enabled else 'disabled'} ({'configured' if self.openrouter_api_key else 'no API key'})")
-        logger.info(f"  Azure: {'enabled' if self.azure_enabled else 'disabled'} ({'configured' if self.azure_endpoint and self.azure_api_key else 'incomplete config'})")
-        logger.info(f"  Timeouts: local={self.local_timeout}s, overflow={self.overflow_timeout}s")
-        logger.info(f"  Performance: max_concurrent={self.max_concurrent_requests}, request_timeout={self.request_timeout}s")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("SwarmRouter (Waggle) Configuration:", extra={"config": self.to_dict()})
+        logger.info("  LM Studio: %s (%s)", "enabled" if self.lm_studio_enabled else "disabled", self.lm_studio_url)
+        logger.info("  OpenRouter: %s (%s)", "enabled" if self.openrouter_enabled else "disabled",
+                    "configured" if self.openrouter_api_key else "no API key")
+        logger.info("  Azure: %s (%s)", "enabled" if self.azure_enabled else "disabled",
+                    "configured" if self.azure_endpoint and self.azure_api_key else "incomplete config")
+        logger.info("  Timeouts: local=%ss, overflow=%ss", self.local_timeout, self.overflow_timeout)
+        logger.info("  Performance: max_concurrent=%s, request_timeout=%ss", self.max_concurrent_requests, self.request_timeout)
+    
+    def _get_lmstudio(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.lm_studio_enabled,
+            "url": self.lm_studio_url,
+            "timeout": self.local_timeout
+        }
+    
+    def _get_openrouter(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.openrouter_enabled,
+            "api_key": self.openrouter_api_key,
+            "base_url": self.openrouter_base_url,
+            "timeout": self.overflow_timeout
+        }
+    
+    def _get_azure(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.azure_enabled,
+            "endpoint": self.azure_endpoint,
+            "api_key": self.azure_api_key,
+            "api_version": self.azure_api_version,
+            "timeout": self.overflow_timeout
+        }
+    
+    def _update_lmstudio(self, config_updates: Dict[str, Any]):
+        if "url" in config_updates:
+            self.lm_studio_url = config_updates["url"]
+        if "timeout" in config_updates:
+            self.local_timeout = config_updates["timeout"]
+        if "enabled" in config_updates:
+            self.lm_studio_enabled = config_updates["enabled"]
+    
+    def _update_openrouter(self, config_updates: Dict[str, Any]):
+        if "api_key" in config_updates:
+            self.openrouter_api_key = config_updates["api_key"]
+        if "base_url" in config_updates:
+            self.openrouter_base_url = config_updates["base_url"]
+        if "timeout" in config_updates:
+            self.overflow_timeout = config_updates["timeout"]
+        if "enabled" in config_updates:
+            self.openrouter_enabled = config_updates["enabled"]
+    
+    def _update_azure(self, config_updates: Dict[str, Any]):
+        if "endpoint" in config_updates:
+            self.azure_endpoint = config_updates["endpoint"]
+        if "api_key" in config_updates:
+            self.azure_api_key = config_updates["api_key"]
+        if "api_version" in config_updates:
+            self.azure_api_version = config_updates["api_version"]
+        if "timeout" in config_updates:
+            self.overflow_timeout = config_updates["timeout"]
+        if "enabled" in config_updates:
+            self.azure_enabled = config_updates["enabled"]
+    
+    # Per-provider handlers keyed by lower-cased provider_type (unbound methods)
+    _GETTERS = {
+        "lmstudio": _get_lmstudio,
+        "openrouter": _get_openrouter,
+        "azure": _get_azure,
+    }
+    _UPDATERS = {
+        "lmstudio": _update_lmstudio,
+        "openrouter": _update_openrouter,
+        "azure": _update_azure,
+    }
     
     def get_provider_config(self, provider_type: str) -> Dict[str, Any]:
         """
@@ -232,32 +462,11 @@ class Config:
         Returns:
             Configuration dictionary for the provider
         """
-        if provider_type.lower() == "lmstudio":
-            return {
-                "enabled": self.lm_studio_enabled,
-                "url": self.lm_studio_url,
-                "timeout": self.local_timeout
-            }
-        
-        elif provider_type.lower() == "openrouter":
-            return {
-                "enabled": self.openrouter_enabled,
-                "api_key": self.openrouter_api_key,
-                "base_url": self.openrouter_base_url,
-                "timeout": self.overflow_timeout
-            }
-        
-        elif provider_type.lower() == "azure":
-            return {
-                "enabled": self.azure_enabled,
-                "endpoint": self.azure_endpoint,
-                "api_key": self.azure_api_key,
-                "api_version": self.azure_api_version,
-                "timeout": self.overflow_timeout
-            }
-        
-        else:
-            raise ValueError(f"Unknown provider type: {provider_type}")
+        try:
+            getter = self._GETTERS[provider_type.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown provider type: {provider_type}") from None
+        return getter(self)
     
     def update_provider_config(self, provider_type: str, config_updates: Dict[str, Any]):
         """
@@ -275,44 +484,28 @@ class Config:
         Args:
             provider_type: Type of provider to update
             config_updates: Dictionary of configuration updates
+            
+        Raises:
+            ValueError: If the updates do not match PROVIDER_CONFIG_SCHEMA or
+                leave the configuration invalid
         """
-        if provider_type.lower() == "lmstudio":
-            if "url" in config_updates:
-                self.lm_studio_url = config_updates["url"]
-            if "timeout" in config_updates:
-                self.local_timeout = config_updates["timeout"]
-            if "enabled" in config_updates:
-                self.lm_studio_enabled = config_updates["enabled"]
-                
-        elif provider_type.lower() == "openrouter":
-            if "api_key" in config_updates:
-                self.openrouter_api_key = config_updates["api_key"]
-            if "base_url" in config_updates:
-                self.openrouter_base_url = config_updates["base_url"]
-            if "timeout" in config_updates:
-                self.overflow_timeout = config_updates["timeout"]
-            if "enabled" in config_updates:
-                self.openrouter_enabled = config_updates["enabled"]
-                
-        elif provider_type.lower() == "azure":
-            if "endpoint" in config_updates:
-                self.azure_endpoint = config_updates["endpoint"]
-            if "api_key" in config_updates:
-                self.azure_api_key = config_updates["api_key"]
-            if "api_version" in config_updates:
-                self.azure_api_version = config_updates["api_version"]
-            if "timeout" in config_updates:
-                self.overflow_timeout = config_updates["timeout"]
-            if "enabled" in config_updates:
-                self.azure_enabled = config_updates["enabled"]
+        provider_type = provider_type.lower()
+        try:
+            updater = self._UPDATERS[provider_type]
+        except KeyError:
+            raise ValueError(f"Unknown provider type: {provider_type}") from None
         
-        else:
-            raise ValueError(f"Unknown provider type: {provider_type}")
+        if _VALIDATOR is not None:
+            _check_provider_schema(provider_type, config_updates)
         
-        # Re-validate configuration after updates
-        self._validate_configuration()
+        updater(self, config_updates)
         
-        logger.info(f"Updated configuration for {provider_type}")
+        # Re-validate the updated provider, unless the schema already covered
+        # everything that changed; other providers' settings are untouched
+        if _VALIDATOR is None or not config_updates.keys() <= _SCHEMA_ONLY_FIELDS:
+            self._validate_provider(provider_type)
+        
+        logger.info("Updated configuration for %s", provider_type)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -343,10 +536,38 @@ class Config:
                 "api_key_configured": bool(self.azure_api_key)
             },
             "general": {
+                "overflow_backend": self.overflow_backend,
                 "max_retries": self.max_retries,
                 "retry_delay": self.retry_delay,
                 "log_level": self.log_level,
                 "max_concurrent_requests": self.max_concurrent_requests,
-                "request_timeout": self.request_timeout
+                "request_timeout": self.request_timeout,
+                "health_ttl": self.health_ttl,
+                "health_interval": self.health_interval,
+                "health_probe": self.health_probe,
+                "hedge_multiplier": self.hedge_multiplier
             }
-        }
\ No newline at end of file
+        }
+
+
+# Process-wide configuration instance, built on first use
+_CONFIG_SINGLETON: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """
+    Return the shared Config, loading and validating it on first call.
+    
+    Re-imports of the application module reuse this instance instead of
+    re-reading the environment.
+    """
+    global _CONFIG_SINGLETON
+    if _CONFIG_SINGLETON is None:
+        _CONFIG_SINGLETON = Config()
+    return _CONFIG_SINGLETON
+
+
+def reset_config():
+    """Discard the shared Config so the next get_config() reloads it (for tests)."""
+    global _CONFIG_SINGLETON
+    _CONFIG_SINGLETON = None
@@ -18,59 +18,165 @@ Stretch Goals (future iterations):
 - Comprehensive metrics and monitoring
 """
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import uvicorn
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Optional
+import asyncio
 import logging
+import os
+
+try:
+    import orjson  # noqa: F401  (ORJSONResponse needs it at render time)
+    from fastapi.responses import ORJSONResponse as _JSONResponseClass
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    _JSONResponseClass = JSONResponse
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 try:
     from .router import SwarmRouter
-    from .config import Config
+    from .config import get_config
 except ImportError:
     # Fallback for direct execution
     from router import SwarmRouter
-    from config import Config
+    from config import get_config
 
 # Initialize logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The router (and the configuration it validates) is built on the first
+# request that needs it, so importing the app and starting a worker stay cheap.
+# The concurrency gate is sized from the same config and created alongside it.
+_router_lock = asyncio.Lock()
+
+
+async def get_router(request: Request) -> SwarmRouter:
+    """Dependency returning the shared SwarmRouter, creating it on first use."""
+    router = getattr(request.app.state, "router", None)
+    if router is None:
+        async with _router_lock:
+            router = getattr(request.app.state, "router", None)
+            if router is None:
+                config = get_config()
+                request.app.state.gate = asyncio.Semaphore(config.max_concurrent_requests)
+                router = SwarmRouter(config)
+                router.start_health_monitor()
+                request.app.state.router = router
+    return router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close provider connections on shutdown if a router was created."""
+    app.state.router = None
+    app.state.gate = None
+    yield
+    router = app.state.router
+    if router is not None:
+        await router.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SwarmRouter (Waggle)",
     description="AI Model Router - MVP for intelligent request routing",
-    version="0.1.0-mvp"
+    version="0.1.0-mvp",
+    lifespan=lifespan,
+    default_response_class=_JSONResponseClass
 )
 
-# Initialize router with configuration
-config = Config()
-router = SwarmRouter(config)
+
+if HAS_MSGSPEC:
+    class ProviderConfigUpdate(msgspec.Struct):
+        """Body of /admin/overflow_provider; unknown fields are ignored."""
+        type: str
+        api_key: "str | msgspec.UnsetType" = msgspec.UNSET
+        endpoint: "str | msgspec.UnsetType" = msgspec.UNSET
+    
+    _PROVIDER_CONFIG_DECODER = msgspec.json.Decoder(ProviderConfigUpdate)
+
+
+async def _read_provider_config(request: Request) -> Dict[str, Any]:
+    """Decode an overflow provider update, with the provider type lower-cased."""
+    if HAS_MSGSPEC:
+        update = _PROVIDER_CONFIG_DECODER.decode(await request.body())
+        provider_config = {
+            field: value for field, value in msgspec.structs.asdict(update).items()
+            if value is not msgspec.UNSET
+        }
+    else:
+        provider_config = await request.json()
+        if not isinstance(provider_config, dict) or not isinstance(provider_config.get("type"), str):
+            raise ValueError("Expected a JSON object with a string 'type'")
+    provider_config["type"] = provider_config["type"].lower()
+    return provider_config
+
+
+async def _prepend(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield an already-received frame ahead of the remainder of a stream."""
+    yield first
+    async for frame in rest:
+        yield frame
+
+
+async def _gated(gate: asyncio.Semaphore, call, *args):
+    """Run call(*args) while holding a slot of the concurrency gate."""
+    async with gate:
+        return await call(*args)
+
+
+# The root payload never changes, so it is encoded once at import
+_ROOT_BYTES = _JSONResponseClass(content={
+    "service": "SwarmRouter",
+    "codename": "waggle",
+    "version": "0.1.0-mvp",
+    "status": "active",
+    "description": "AI model request router with local and cloud failover"
+}).body
+
+# endpoint -> (router status object the bytes were built from, encoded body)
+_ENCODED_STATUS: Dict[str, tuple] = {}
+
+
+def _encoded_status(endpoint: str, source: Dict[str, Any], build) -> Response:
+    """
+    Serve build()'s JSON body, re-encoding only when source has changed.
+    
+    The router hands back the same status object until its health_ttl
+    cache expires, so identity is enough to tell whether the bytes are stale.
+    """
+    cached = _ENCODED_STATUS.get(endpoint)
+    if cached is None or cached[0] is not source:
+        cached = _ENCODED_STATUS[endpoint] = (source, _JSONResponseClass(content=build()).body)
+    return Response(content=cached[1], media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """Root endpoint providing basic service information."""
-    return {
-        "service": "SwarmRouter",
-        "codename": "waggle",
-        "version": "0.1.0-mvp",
-        "status": "active",
-        "description": "AI model request router with local and cloud failover"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
-async def health_check():
-    """Health check endpoint for monitoring and load balancers."""
-    return {
-        "status": "healthy",
-        "providers": await router.get_provider_status()
-    }
+async def health_check(router: SwarmRouter = Depends(get_router)):
+    """
+    Health check endpoint for monitoring and load balancers.
+    
+    Serves the router's pre-encoded health snapshot, which is built when the
+    router is created and refreshed every config.health_interval seconds.
+    """
+    return Response(content=router.health_snapshot, media_type="application/json")
 
 
 @app.post("/v1/chat/completions")
-async def chat_completions(request: Request):
+async def chat_completions(request: Request, router: SwarmRouter = Depends(get_router)):
     """
     OpenAI-compatible chat completions endpoint.
     
@@ -89,17 +195,37 @@ async def chat_completions(request: Request):
     - Request caching and deduplication
     - Advanced load balancing algorithms
     """
+    gate = request.app.state.gate
+    timeout = router.config.request_timeout
+    
     try:
         # Parse request body
         body = await request.json()
         
-        # Route the request through our router
-        response = await router.route_chat_completion(body)
+        if body.get("stream"):
+            # Pull the first frame before responding so that a request no
+            # provider can serve still fails with a 500 rather than an empty stream.
+            # The gate covers stream setup; the adapter's own semaphore bounds the body.
+            stream = router.stream_chat_completion(body)
+            first = await asyncio.wait_for(_gated(gate, stream.__anext__), timeout=timeout)
+            return StreamingResponse(_prepend(first, stream), media_type="text/event-stream")
         
-        return response
+        # Route the request through our router; requests beyond
+        # max_concurrent_requests wait for the gate, and that wait counts
+        # toward request_timeout
+        response = await asyncio.wait_for(_gated(gate, router.route_chat_completion, body), timeout=timeout)
         
+        # Provider responses are already plain JSON; skip jsonable_encoder
+        return _JSONResponseClass(content=response)
+        
+    except asyncio.TimeoutError:
+        logger.error("Chat completion exceeded request timeout of %ss", timeout)
+        raise HTTPException(
+            status_code=504,
+            detail="Request timed out during routing"
+        )
     except Exception as e:
-        logger.error(f"Error processing chat completion: {str(e)}")
+        logger.error("Error processing chat completion: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error during request routing"
@@ -107,7 +233,7 @@ async def chat_completions(request: Request):
 
 
 @app.post("/admin/overflow_provider")
-async def set_overflow_provider(provider_config: Dict[str, Any]):
+async def set_overflow_provider(request: Request, router: SwarmRouter = Depends(get_router)):
     """
     Administrative endpoint to configure overflow providers.
     
@@ -121,11 +247,12 @@ async def set_overflow_provider(provider_config: Dict[str, Any]):
     - Gradual traffic shifting for provider changes
     """
     try:
+        provider_config = await _read_provider_config(request)
         result = await router.configure_overflow_provider(provider_config)
         return {"status": "success", "result": result}
         
     except Exception as e:
-        logger.error(f"Error configuring overflow provider: {str(e)}")
+        logger.error("Error configuring overflow provider: %s", e)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to configure provider: {str(e)}"
@@ -133,7 +260,7 @@ async def set_overflow_provider(provider_config: Dict[str, Any]):
 
 
 @app.get("/admin/status")
-async def get_admin_status():
+async def get_admin_status(router: SwarmRouter = Depends(get_router)):
     """
     Administrative status endpoint providing detailed system information.
     
@@ -141,10 +268,10 @@ async def get_admin_status():
     """
     try:
         status = await router.get_detailed_status()
-        return status
+        return _encoded_status("admin_status", status, lambda: status)
         
     except Exception as e:
-        logger.error(f"Error getting admin status: {str(e)}")
+        logger.error("Error getting admin status: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Unable to retrieve system status"
@@ -152,11 +279,26 @@ async def get_admin_status():
 
 
 if __name__ == "__main__":
-    # Development server configuration
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    if os.getenv("SWARMROUTER_DEV"):
+        # Development server: single process with auto-reload
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # Router state (provider stats, admin config changes) lives in each
+        # worker process, so /admin updates only reach the worker that served
+        # them. Keep one worker unless that is acceptable.
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="auto",
+            http="auto",
+            workers=int(os.getenv("SWARMROUTER_WORKERS", "1")),
+            log_level="info"
+        )
\ No newline at end of file
@@ -12,7 +12,7 @@ MVP Architecture:
 
 Stretch Goals (future iterations):
 - Machine learning-based routing decisions
-- Advanced load balancing algorithms (weighted round-robin, least connections)
+- Advanced load balancing algorithms (weighted round-robin)
 - Model-specific routing optimization
 - Request batching and optimization
 - Comprehensive metrics and analytics
@@ -20,17 +20,16 @@ Stretch Goals (future iterations):
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncGenerator, List, Optional
 from enum import Enum
 import time
-import random
 
 try:
-    from .adapters import LMStudioAdapter, OpenRouterAdapter, AzureAdapter
+    from .adapters import LMStudioAdapter, OpenRouterAdapter, AzureAdapter, cleanup_adapters, _json_dumps
     from .config import Config
 except ImportError:
     # Fallback for direct execution
-    from adapters import LMStudioAdapter, OpenRouterAdapter, AzureAdapter
+    from adapters import LMStudioAdapter, OpenRouterAdapter, AzureAdapter, cleanup_adapters, _json_dumps
     from config import Config
 
 logger = logging.getLogger(__name__)
@@ -58,6 +57,18 @@ class SwarmRouter:
     for AI model requests in the MVP implementation.
     """
     
+    # Response-time EWMA weight is 1/EWMA_WINDOW (alpha = 0.1)
+    EWMA_WINDOW = 10
+    
+    # Number of most recent attempts that decide a provider's status
+    OUTCOME_WINDOW = 64
+    
+    # Attempts needed in the window before a provider can be marked UNAVAILABLE
+    MIN_OUTCOMES = 5
+    
+    # An UNAVAILABLE provider gets one real request this often, so it can recover
+    TRIAL_INTERVAL_SECONDS = 30.0
+    
     def __init__(self, config: Config):
         """
         Initialize the SwarmRouter with configuration.
@@ -69,9 +80,24 @@ class SwarmRouter:
         self.providers = {}
         self.provider_stats = {}
         self.last_health_check = 0
+        self._started_ns = time.monotonic_ns()  # uptime origin, immune to wall-clock changes
+        self._status_cache = {}  # status name -> (monotonic timestamp, payload)
+        self._health_task: Optional[asyncio.Task] = None
+        self._adapter_calls = {}  # adapter -> calls in progress on it
+        self._retired = set()  # replaced adapters closed once their calls finish
+        self._background = set()  # strong references to fire-and-forget tasks
+        self._warmups = set()  # connection warmup tasks, cancelled on close
+        self.health_snapshot = b""  # encoded /health body, refreshed by the health loop
+        
+        # Eligible providers for _get_routing_order, rebuilt when _order_dirty
+        self._local_candidates: List[ProviderType] = []
+        self._overflow_candidates: List[ProviderType] = []
+        self._next_trial_at = float("inf")  # earliest retry_at among UNAVAILABLE providers
+        self._order_dirty = True
         
         # Initialize adapters for each provider type
         self._initialize_providers()
+        self._refresh_health_snapshot()
     
     def _initialize_providers(self):
         """
@@ -86,12 +112,20 @@ class SwarmRouter:
         if self.config.lm_studio_enabled:
             self.providers[ProviderType.LOCAL] = LMStudioAdapter(
                 base_url=self.config.lm_studio_url,
-                timeout=self.config.local_timeout
+                timeout=self.config.local_timeout,
+                max_concurrency=self.config.max_concurrent_requests,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay
             )
             self.provider_stats[ProviderType.LOCAL] = {
                 "requests": 0,
                 "errors": 0,
-                "avg_response_time": 0,
+                "in_flight": 0,
+                "avg_response_time_us": 0,
+                "ewma_initialized": False,
+                "outcome_bits": 0,
+                "outcome_count": 0,
+                "retry_at": 0.0,  # monotonic time of the next trial while UNAVAILABLE
                 "status": ProviderStatus.HEALTHY
             }
         
@@ -99,12 +133,21 @@ class SwarmRouter:
         if self.config.openrouter_enabled:
             self.providers[ProviderType.OPENROUTER] = OpenRouterAdapter(
                 api_key=self.config.openrouter_api_key,
-                timeout=self.config.overflow_timeout
+                timeout=self.config.overflow_timeout,
+                max_concurrency=self.config.max_concurrent_requests,
+                backend=self.config.overflow_backend,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay
             )
             self.provider_stats[ProviderType.OPENROUTER] = {
                 "requests": 0,
                 "errors": 0,
-                "avg_response_time": 0,
+                "in_flight": 0,
+                "avg_response_time_us": 0,
+                "ewma_initialized": False,
+                "outcome_bits": 0,
+                "outcome_count": 0,
+                "retry_at": 0.0,
                 "status": ProviderStatus.HEALTHY
             }
         
@@ -113,12 +156,21 @@ class SwarmRouter:
             self.providers[ProviderType.AZURE] = AzureAdapter(
                 endpoint=self.config.azure_endpoint,
                 api_key=self.config.azure_api_key,
-                timeout=self.config.overflow_timeout
+                timeout=self.config.overflow_timeout,
+                max_concurrency=self.config.max_concurrent_requests,
+                backend=self.config.overflow_backend,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay
             )
             self.provider_stats[ProviderType.AZURE] = {
                 "requests": 0,
                 "errors": 0,
-                "avg_response_time": 0,
+                "in_flight": 0,
+                "avg_response_time_us": 0,
+                "ewma_initialized": False,
+                "outcome_bits": 0,
+                "outcome_count": 0,
+                "retry_at": 0.0,
                 "status": ProviderStatus.HEALTHY
             }
         
@@ -131,7 +183,11 @@ class SwarmRouter:
         MVP Routing Logic:
         1. Try local provider first (LM Studio)
         2. Fall back to overflow providers on failure
-        3. Simple round-robin between overflow providers
+        3. Overflow providers with the fewest in-flight requests first
+        4. If config.hedge_multiplier is set and a provider takes longer than
+           that multiple of its average response time, start the next
+           provider concurrently; the first success wins and the rest are
+           cancelled
         
         Args:
             request_data: OpenAI-format chat completion request
@@ -142,46 +198,172 @@ class SwarmRouter:
         Raises:
             Exception: If all providers fail
         """
+        # Determine routing order based on configuration and health
+        candidates = iter([p for p in self._get_routing_order(request_data) if p in self.providers])
+        attempts = {}  # asyncio.Task -> ProviderType
+        hedge_at = None  # monotonic time at which to start the next provider early
+        last_error = None
+        
+        def launch_next() -> bool:
+            nonlocal hedge_at
+            provider_type = next(candidates, None)
+            if provider_type is None:
+                hedge_at = None
+                return False
+            task = asyncio.create_task(self._attempt_chat_completion(provider_type, request_data))
+            attempts[task] = provider_type
+            delay = self._hedge_delay(provider_type)
+            hedge_at = None if delay is None else time.monotonic() + delay
+            return True
+        
+        try:
+            launch_next()
+            while attempts:
+                timeout = None if hedge_at is None else max(hedge_at - time.monotonic(), 0)
+                done, _ = await asyncio.wait(attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    # Slower than usual: hedge with the next provider, keep waiting on both
+                    launch_next()
+                    continue
+                
+                winner = None
+                for task in done:
+                    # Retrieve every exception, even beside a success, so
+                    # asyncio does not log it as never retrieved
+                    del attempts[task]
+                    error = task.exception()
+                    if error is None:
+                        winner = winner or task
+                    else:
+                        last_error = error
+                if winner is not None:
+                    return winner.result()
+                
+                if not attempts:
+                    # Fail over to the next provider
+                    launch_next()
+        finally:
+            # Cancel hedges that lost (or everything, if the caller was cancelled)
+            for task in attempts:
+                task.cancel()
+        
+        # All providers failed
+        logger.error("All providers failed for request")
+        raise Exception(f"All providers unavailable. Last error: {str(last_error)}")
+    
+    async def _attempt_chat_completion(self, provider_type: ProviderType, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request to one provider, tracking in-flight count and stats."""
+        logger.info(f"Attempting request with provider: {provider_type.value}")
+        
+        provider = self.providers[provider_type]
+        stats = self.provider_stats[provider_type]
         start_time = time.time()
+        stats["in_flight"] += 1
+        self._checkout(provider)
+        try:
+            response = await provider.chat_completion(request_data)
+        except Exception as e:
+            logger.warning(f"Provider {provider_type.value} failed: {str(e)}")
+            self._record_outcome(provider_type, provider, time.time() - start_time, success=False)
+            raise
+        finally:
+            stats["in_flight"] -= 1
+            self._checkin(provider)
         
-        # Determine routing order based on configuration and health
-        routing_order = await self._get_routing_order(request_data)
+        # Update success statistics
+        self._record_outcome(provider_type, provider, time.time() - start_time, success=True)
+        
+        logger.info(f"Successfully routed request via {provider_type.value}")
+        return response
+    
+    def _hedge_delay(self, provider_type: ProviderType) -> Optional[float]:
+        """
+        Seconds to wait on a provider before also trying the next one.
+        
+        None (never hedge) when hedging is disabled or the provider has no
+        latency history yet.
+        """
+        multiplier = self.config.hedge_multiplier
+        stats = self.provider_stats[provider_type]
+        if multiplier <= 0 or not stats["ewma_initialized"]:
+            return None
+        return stats["avg_response_time_us"] * multiplier / 1e6
+    
+    async def stream_chat_completion(self, request_data: Dict[str, Any]) -> AsyncGenerator[bytes, None]:
+        """
+        Route a streaming chat completion, yielding server-sent event frames.
+        
+        Providers are tried in routing order until one produces its first
+        chunk; after that the stream is committed to that provider and a
+        mid-stream failure is raised rather than failed over.
+        
+        Args:
+            request_data: OpenAI-format chat completion request
+            
+        Yields:
+            ``data: ...`` SSE frames, ending with ``data: [DONE]``
+            
+        Raises:
+            Exception: If all providers fail before streaming starts
+        """
+        routing_order = self._get_routing_order(request_data)
         
         last_error = None
         
         for provider_type in routing_order:
             if provider_type not in self.providers:
                 continue
-                
+            
+            provider = self.providers[provider_type]
+            start_time = time.time()
+            started = False
+            stats = self.provider_stats[provider_type]
+            stats["in_flight"] += 1
+            self._checkout(provider)
             try:
-                logger.info(f"Attempting request with provider: {provider_type.value}")
-                
-                provider = self.providers[provider_type]
-                response = await provider.chat_completion(request_data)
-                
-                # Update success statistics
-                self._update_provider_stats(provider_type, time.time() - start_time, success=True)
-                
-                logger.info(f"Successfully routed request via {provider_type.value}")
-                return response
+                logger.info(f"Attempting stream with provider: {provider_type.value}")
                 
+                async for chunk in provider.chat_completion_stream(request_data):
+                    if not started:
+                        # Time to first chunk is the latency routing cares
+                        # about; the rest depends on how much the model says
+                        started = True
+                        self._record_outcome(provider_type, provider, time.time() - start_time, success=True)
+                    yield b"data: " + _json_dumps(chunk) + b"\n\n"
+                    
             except Exception as e:
-                logger.warning(f"Provider {provider_type.value} failed: {str(e)}")
-                self._update_provider_stats(provider_type, time.time() - start_time, success=False)
+                logger.warning(f"Provider {provider_type.value} stream failed: {str(e)}")
+                self._record_outcome(provider_type, provider, time.time() - start_time, success=False)
+                if started:
+                    raise
                 last_error = e
                 continue
+            finally:
+                stats["in_flight"] -= 1
+                self._checkin(provider)
+            
+            if not started:
+                self._record_outcome(provider_type, provider, time.time() - start_time, success=True)
+            yield b"data: [DONE]\n\n"
+            return
         
-        # All providers failed
-        logger.error("All providers failed for request")
+        logger.error("All providers failed for streaming request")
         raise Exception(f"All providers unavailable. Last error: {str(last_error)}")
     
-    async def _get_routing_order(self, request_data: Dict[str, Any]) -> List[ProviderType]:
+    def _get_routing_order(self, request_data: Dict[str, Any]) -> List[ProviderType]:
         """
         Determine the order in which to try providers for a request.
         
         MVP Implementation:
         - Local provider first (if healthy)
-        - Overflow providers in configured order
+        - Overflow providers ordered by fewest in-flight requests, then by
+          average response time
+        
+        Which providers are eligible only changes when a status transitions
+        or a provider is replaced, so that part is cached behind
+        _order_dirty; only the (at most two) overflow candidates are sorted
+        per request.
         
         Stretch Goals:
         - Model-specific routing preferences
@@ -194,31 +376,73 @@ class SwarmRouter:
         Returns:
             Ordered list of provider types to try
         """
-        routing_order = []
+        if self._order_dirty:
+            self._rebuild_routing_candidates()
+        
+        local = self._local_candidates
+        overflow = self._overflow_candidates
+        if time.monotonic() >= self._next_trial_at:
+            # Let UNAVAILABLE providers that are due a trial take this request
+            for provider_type in self._admit_trials():
+                if provider_type is ProviderType.LOCAL:
+                    local = [provider_type]
+                else:
+                    overflow = overflow + [provider_type]
+        
+        if len(overflow) < 2:
+            return local + overflow
+        
+        # Least connections first, then lowest average response time
+        stats = self.provider_stats
+        return local + sorted(
+            overflow, key=lambda p: (stats[p]["in_flight"], stats[p]["avg_response_time_us"])
+        )
+    
+    def _rebuild_routing_candidates(self):
+        """Recompute which local and overflow providers are eligible for routing."""
+        stats = self.provider_stats
         
         # Always try local first if available and healthy
-        if (ProviderType.LOCAL in self.providers and 
-            self.provider_stats[ProviderType.LOCAL]["status"] != ProviderStatus.UNAVAILABLE):
-            routing_order.append(ProviderType.LOCAL)
-        
-        # Add overflow providers based on health and configuration
-        overflow_providers = [
-            ProviderType.OPENROUTER,
-            ProviderType.AZURE
-        ]
+        self._local_candidates = [
+            ProviderType.LOCAL
+        ] if (ProviderType.LOCAL in self.providers and
+              stats[ProviderType.LOCAL]["status"] != ProviderStatus.UNAVAILABLE) else []
         
-        # Filter to available and healthy providers
-        available_overflow = [
-            p for p in overflow_providers 
-            if p in self.providers and 
-            self.provider_stats[p]["status"] != ProviderStatus.UNAVAILABLE
+        # Filter overflow providers to available and healthy ones
+        self._overflow_candidates = [
+            p for p in (ProviderType.OPENROUTER, ProviderType.AZURE)
+            if p in self.providers and
+            stats[p]["status"] != ProviderStatus.UNAVAILABLE
         ]
+        self._schedule_next_trial()
+        self._order_dirty = False
+    
+    def _unavailable_providers(self) -> List[ProviderType]:
+        stats = self.provider_stats
+        return [p for p in self.providers if stats[p]["status"] is ProviderStatus.UNAVAILABLE]
+    
+    def _schedule_next_trial(self):
+        self._next_trial_at = min(
+            (self.provider_stats[p]["retry_at"] for p in self._unavailable_providers()),
+            default=float("inf")
+        )
+    
+    def _admit_trials(self) -> List[ProviderType]:
+        """
+        UNAVAILABLE providers whose trial is due, each pushed back a full interval.
         
-        # Simple randomization for load distribution among overflow providers
-        random.shuffle(available_overflow)
-        routing_order.extend(available_overflow)
-        
-        return routing_order
+        Only the request that admits a trial is routed to it; a success
+        brings the provider back (see _update_provider_stats).
+        """
+        now = time.monotonic()
+        due = []
+        for provider_type in self._unavailable_providers():
+            stats = self.provider_stats[provider_type]
+            if stats["retry_at"] <= now:
+                stats["retry_at"] = now + self.TRIAL_INTERVAL_SECONDS
+                due.append(provider_type)
+        self._schedule_next_trial()
+        return due
     
     def _update_provider_stats(self, provider_type: ProviderType, response_time: float, success: bool):
         """
@@ -234,20 +458,43 @@ class SwarmRouter:
         stats["requests"] += 1
         
         if success:
-            # Update average response time (simple moving average)
-            if stats["avg_response_time"] == 0:
-                stats["avg_response_time"] = response_time
+            # Exponentially weighted average in integer microseconds; the
+            # first sample seeds it so a cold provider doesn't read as 0
+            rt_us = int(response_time * 1e6)
+            if stats["ewma_initialized"]:
+                window = self.EWMA_WINDOW
+                stats["avg_response_time_us"] = ((window - 1) * stats["avg_response_time_us"] + rt_us) // window
             else:
-                stats["avg_response_time"] = (stats["avg_response_time"] + response_time) / 2
+                stats["avg_response_time_us"] = rt_us
+                stats["ewma_initialized"] = True
         else:
             stats["errors"] += 1
-            
-            # Mark as degraded if error rate is high
-            error_rate = stats["errors"] / stats["requests"]
-            if error_rate > 0.5:  # More than 50% error rate
-                stats["status"] = ProviderStatus.DEGRADED
-            if error_rate > 0.8:  # More than 80% error rate
-                stats["status"] = ProviderStatus.UNAVAILABLE
+        
+        previous_status = stats["status"]
+        if success and previous_status is ProviderStatus.UNAVAILABLE:
+            # A trial request got through; judge it on fresh outcomes
+            stats["outcome_bits"] = 0
+            stats["outcome_count"] = 0
+        
+        # Status follows the success ratio over the last OUTCOME_WINDOW
+        # attempts (one bit each, 1 = success), so providers can recover
+        window = self.OUTCOME_WINDOW
+        bits = ((stats["outcome_bits"] << 1) | success) & ((1 << window) - 1)
+        count = min(stats["outcome_count"] + 1, window)
+        stats["outcome_bits"] = bits
+        stats["outcome_count"] = count
+        
+        successes = bits.bit_count()
+        if successes * 5 >= count * 4:  # At least 80% success
+            stats["status"] = ProviderStatus.HEALTHY
+        elif successes * 2 >= count or count < self.MIN_OUTCOMES:  # At least 50%, or too few to judge
+            stats["status"] = ProviderStatus.DEGRADED
+        else:
+            stats["status"] = ProviderStatus.UNAVAILABLE
+        if stats["status"] is not previous_status:
+            if stats["status"] is ProviderStatus.UNAVAILABLE:
+                stats["retry_at"] = time.monotonic() + self.TRIAL_INTERVAL_SECONDS
+            self._order_dirty = True
     
     async def configure_overflow_provider(self, provider_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -268,42 +515,201 @@ class SwarmRouter:
         if provider_type == "openrouter":
             # Update OpenRouter configuration
             if "api_key" in provider_config:
-                self.config.openrouter_api_key = provider_config["api_key"]
+                self.config.update_provider_config("openrouter", {"api_key": provider_config["api_key"]})
                 
             # Reinitialize the provider
-            self.providers[ProviderType.OPENROUTER] = OpenRouterAdapter(
+            await self._replace_provider(ProviderType.OPENROUTER, OpenRouterAdapter(
                 api_key=self.config.openrouter_api_key,
-                timeout=self.config.overflow_timeout
-            )
+                timeout=self.config.overflow_timeout,
+                max_concurrency=self.config.max_concurrent_requests,
+                backend=self.config.overflow_backend,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay
+            ))
             
             return {"provider": "openrouter", "status": "configured"}
             
         elif provider_type == "azure":
             # Update Azure configuration
-            if "endpoint" in provider_config:
-                self.config.azure_endpoint = provider_config["endpoint"]
-            if "api_key" in provider_config:
-                self.config.azure_api_key = provider_config["api_key"]
+            updates = {key: provider_config[key] for key in ("endpoint", "api_key") if key in provider_config}
+            if updates:
+                self.config.update_provider_config("azure", updates)
                 
             # Reinitialize the provider
-            self.providers[ProviderType.AZURE] = AzureAdapter(
+            await self._replace_provider(ProviderType.AZURE, AzureAdapter(
                 endpoint=self.config.azure_endpoint,
                 api_key=self.config.azure_api_key,
-                timeout=self.config.overflow_timeout
-            )
+                timeout=self.config.overflow_timeout,
+                max_concurrency=self.config.max_concurrent_requests,
+                backend=self.config.overflow_backend,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay
+            ))
             
             return {"provider": "azure", "status": "configured"}
         
         else:
             raise ValueError(f"Unsupported provider type: {provider_type}")
     
+    async def _replace_provider(self, provider_type: ProviderType, provider):
+        """
+        Swap in a new adapter, then release the old one.
+        
+        Calls already running on the old adapter are allowed to finish; it is
+        closed in the background after the last one, since closing it now
+        could drop the shared host session under them.
+        """
+        previous = self.providers.get(provider_type)
+        self.providers[provider_type] = provider
+        self._order_dirty = True
+        stats = self.provider_stats.get(provider_type)
+        if stats is not None:
+            # A reconfigured provider starts over with a clean outcome window
+            stats["outcome_bits"] = 0
+            stats["outcome_count"] = 0
+            stats["status"] = ProviderStatus.HEALTHY
+        if previous is None:
+            return
+        if previous in self._adapter_calls:
+            self._retired.add(previous)
+        else:
+            await previous.close()
+    
+    def _checkout(self, provider):
+        """Count a call starting on an adapter."""
+        self._adapter_calls[provider] = self._adapter_calls.get(provider, 0) + 1
+    
+    def _checkin(self, provider):
+        """Count a call finishing on an adapter, closing it if it was retired and is now idle."""
+        remaining = self._adapter_calls.pop(provider) - 1
+        if remaining:
+            self._adapter_calls[provider] = remaining
+        elif provider in self._retired:
+            self._retired.discard(provider)
+            self._spawn(provider.close(), self._background)
+    
+    @staticmethod
+    def _spawn(coro, tasks: set):
+        """Run coro as a task, holding a reference in tasks until it finishes."""
+        task = asyncio.create_task(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    
+    def _record_outcome(self, provider_type: ProviderType, provider, response_time: float, success: bool):
+        """Update stats for a finished attempt, unless its adapter has since been replaced."""
+        if self.providers.get(provider_type) is provider:
+            self._update_provider_stats(provider_type, response_time, success)
+    
+    def start_health_monitor(self):
+        """
+        Start the background health loop (needs a running event loop; idempotent).
+        
+        The first start also pre-opens connections to every provider, so the
+        first routed request does not pay the TCP/TLS handshake.
+        """
+        if self._health_task is None or self._health_task.done():
+            if self._health_task is None:
+                for provider in self.providers.values():
+                    self._spawn(provider.warmup(), self._warmups)
+            self._health_task = asyncio.create_task(self._health_loop())
+    
+    async def _health_loop(self):
+        """
+        Refresh health_snapshot every config.health_interval seconds.
+        
+        The snapshot is built from provider_stats, so an idle router makes no
+        upstream calls. Only with config.health_probe enabled does a round
+        also probe UNAVAILABLE providers, letting one that answers back into
+        routing.
+        """
+        interval = self.config.health_interval
+        while True:
+            try:
+                if self.config.health_probe:
+                    await self._probe_unavailable_providers(timeout=interval)
+                self._refresh_health_snapshot()
+                self.last_health_check = time.time()
+            except Exception as e:
+                logger.warning(f"Health refresh failed: {str(e)}")
+            await asyncio.sleep(interval)
+    
+    def _refresh_health_snapshot(self):
+        self.health_snapshot = _json_dumps({
+            "status": "healthy",
+            "providers": self._build_provider_status()
+        })
+    
+    async def _probe_unavailable_providers(self, timeout: float):
+        """
+        Health-check UNAVAILABLE providers concurrently and revive ones that respond.
+        
+        Adapters whose health check is billable (Azure's is a real completion)
+        are never probed here; like every provider, they also recover through
+        the trial requests _get_routing_order lets through.
+        """
+        provider_types = [
+            p for p, provider in self.providers.items()
+            if not provider.BILLABLE_HEALTH_CHECK
+            and p in self.provider_stats
+            and self.provider_stats[p]["status"] is ProviderStatus.UNAVAILABLE
+        ]
+        if not provider_types:
+            return
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self.providers[p].health_check(), timeout) for p in provider_types),
+            return_exceptions=True
+        )
+        for provider_type, healthy in zip(provider_types, results):
+            if healthy is True:
+                # Start a fresh outcome window so the next real requests decide
+                logger.info(f"Provider {provider_type.value} answered its health check; re-enabling")
+                stats = self.provider_stats[provider_type]
+                stats["outcome_bits"] = 0
+                stats["outcome_count"] = 0
+                stats["status"] = ProviderStatus.DEGRADED
+                self._order_dirty = True
+    
+    async def close(self):
+        """Stop the health loop and close every provider adapter, including retired ones."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        for task in self._warmups:
+            task.cancel()
+        await asyncio.gather(*self._warmups, *self._background, return_exceptions=True)
+        retired, self._retired = self._retired, set()
+        await cleanup_adapters(*self.providers.values(), *retired)
+    
+    def _cached_status(self, key: str, build) -> Dict[str, Any]:
+        """
+        Return build()'s result, reusing it for config.health_ttl seconds.
+        
+        The entry is stamped after build() completes, so a slow build never
+        shortens the window. build() is synchronous and nothing here awaits,
+        so concurrent callers cannot race to refresh the same entry.
+        """
+        cached = self._status_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.config.health_ttl:
+            return cached[1]
+        payload = build()
+        self._status_cache[key] = (time.monotonic(), payload)
+        return payload
+    
     async def get_provider_status(self) -> Dict[str, Any]:
         """
         Get current status of all providers.
         
+        The snapshot is reused for config.health_ttl seconds so frequent
+        callers do not rebuild it on every call. /health does not use this;
+        it serves health_snapshot.
+        
         Returns:
             Dictionary with provider status information
         """
+        return self._cached_status("providers", self._build_provider_status)
+    
+    def _build_provider_status(self) -> Dict[str, Any]:
         status = {}
         
         for provider_type, stats in self.provider_stats.items():
@@ -311,8 +717,9 @@ class SwarmRouter:
                 "status": stats["status"].value,
                 "requests": stats["requests"],
                 "errors": stats["errors"],
+                "in_flight": stats["in_flight"],
                 "error_rate": stats["errors"] / max(stats["requests"], 1),
-                "avg_response_time": stats["avg_response_time"]
+                "avg_response_time": stats["avg_response_time_us"] / 1e6
             }
         
         return status
@@ -321,13 +728,18 @@ class SwarmRouter:
         """
         Get comprehensive system status for administrative monitoring.
         
+        Cached for config.health_ttl seconds, like get_provider_status.
+        
         Returns:
             Detailed status including configuration and metrics
         """
+        return self._cached_status("detailed", self._build_detailed_status)
+    
+    def _build_detailed_status(self) -> Dict[str, Any]:
         return {
             "service": "SwarmRouter (Waggle)",
             "version": "0.1.0-mvp",
-            "providers": await self.get_provider_status(),
+            "providers": self._cached_status("providers", self._build_provider_status),
             "configuration": {
                 "local_enabled": self.config.lm_studio_enabled,
                 "overflow_providers": [
@@ -336,5 +748,5 @@ class SwarmRouter:
                 ],
                 "routing_strategy": "local_first_with_overflow"
             },
-            "uptime": time.time() - self.last_health_check if self.last_health_check else 0
-        }
\ No newline at end of file
+            "uptime": (time.monotonic_ns() - self._started_ns) / 1e9
+        }
@@ -0,0 +1,31 @@
+"""Shared fixtures for the prototype tests."""
+
+import pytest
+
+from prototype import config as config_module
+from prototype.router import SwarmRouter
+
+
+@pytest.fixture
+def router_config(monkeypatch):
+    """A Config built from a minimal, isolated environment."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    config_module.refresh_env_snapshot()
+    yield config_module.Config()
+    monkeypatch.undo()
+    config_module.refresh_env_snapshot()
+
+
+@pytest.fixture
+def make_router(router_config):
+    """Build a SwarmRouter whose providers are replaced by fakes."""
+
+    def build(providers, **settings):
+        for name, value in settings.items():
+            setattr(router_config, name, value)
+        router = SwarmRouter(router_config)
+        router.providers = dict(providers)
+        router._order_dirty = True
+        return router
+
+    return build
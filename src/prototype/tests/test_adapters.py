@@ -0,0 +1,327 @@
+"""Tests for the prototype provider adapters."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from yarl import URL
+
+from prototype import adapters
+from prototype.adapters import (
+    AzureAdapter,
+    LMStudioAdapter,
+    OpenRouterAdapter,
+    ProviderError,
+    RateLimitError,
+)
+
+
+class TestCapabilities:
+    """Test the class-level capability flags callers check before using an API."""
+
+    def test_only_azure_supports_batch(self):
+        """The asynchronous batch API is Azure-only."""
+        assert AzureAdapter.SUPPORTS_BATCH
+        assert not LMStudioAdapter.SUPPORTS_BATCH
+        assert not OpenRouterAdapter.SUPPORTS_BATCH
+
+    @pytest.mark.asyncio
+    async def test_batch_api_unavailable_without_support(self):
+        """Adapters without SUPPORTS_BATCH refuse batch calls."""
+        adapter = LMStudioAdapter()
+        with pytest.raises(NotImplementedError):
+            await adapter.submit_batch([])
+        with pytest.raises(NotImplementedError):
+            await adapter.get_batch("batch-1")
+
+
+class FakeResponse:
+    """Minimal aiohttp response: a status and a JSON body."""
+
+    def __init__(self, status, body=None):
+        self.status = status
+        self._content = json.dumps(body or {}).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self._content
+
+
+class BodyWriter:
+    """Collects the bytes an aiohttp payload writes."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    async def write(self, chunk):
+        self.data += chunk
+
+
+class FakeSession:
+    """Records requests and answers them from a queue of FakeResponses."""
+
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, data=None):
+        self.requests.append((method, url, headers, data))
+        return self.responses.pop(0)
+
+
+async def uploaded_lines(form: aiohttp.FormData):
+    """Decode the JSONL file part of a multipart upload."""
+    writer = BodyWriter()
+    await form().write(writer)
+    return [json.loads(line) for line in bytes(writer.data).splitlines() if line.startswith(b'{"custom_id"')]
+
+
+class TestAzureBatch:
+    """Test the Azure OpenAI files/batches calls behind submit_batch and get_batch."""
+
+    @pytest.fixture
+    def adapter(self):
+        return AzureAdapter("https://example.openai.azure.com/", "key", api_version="2024-07-01-preview")
+
+    @pytest.mark.asyncio
+    async def test_submit_uploads_jsonl_then_creates_batch(self, adapter):
+        """The requests are uploaded as JSONL and the batch references the file."""
+        adapter.session = FakeSession([
+            FakeResponse(201, {"id": "file-1"}),
+            FakeResponse(200, {"id": "batch-1"}),
+        ])
+        batch_id = await adapter.submit_batch([
+            {"custom_id": "a", "model": "gpt-3.5-turbo", "messages": []},
+            {"model": "unknown-model", "messages": []},
+        ])
+
+        assert batch_id == "batch-1"
+        (upload_method, upload_url, upload_headers, form), (create_method, create_url, _, body) = adapter.session.requests
+        assert (upload_method, create_method) == ("POST", "POST")
+        assert upload_url.path == "/openai/files"
+        assert create_url.path == "/openai/batches"
+        assert upload_url.query["api-version"] == create_url.query["api-version"] == "2024-07-01-preview"
+        assert upload_headers == {"api-key": "key"}
+
+        assert await uploaded_lines(form) == [
+            {"custom_id": "a", "method": "POST", "url": "/chat/completions",
+             "body": {"model": "gpt-35-turbo", "messages": []}},
+            {"custom_id": "request-1", "method": "POST", "url": "/chat/completions",
+             "body": {"model": adapter.default_deployment, "messages": []}},
+        ]
+        assert json.loads(body) == {
+            "input_file_id": "file-1",
+            "endpoint": "/chat/completions",
+            "completion_window": "24h",
+        }
+
+    @pytest.mark.asyncio
+    async def test_submit_without_files_api(self, adapter):
+        """A 404 from the files API names the missing API and stops there."""
+        adapter.session = FakeSession([FakeResponse(404)])
+        with pytest.raises(ProviderError, match="files API not available") as excinfo:
+            await adapter.submit_batch([{"messages": []}])
+        assert excinfo.value.status == 404
+        assert len(adapter.session.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_without_batches_api(self, adapter):
+        """A 404 from the batches API is reported after the upload."""
+        adapter.session = FakeSession([FakeResponse(201, {"id": "file-1"}), FakeResponse(404)])
+        with pytest.raises(ProviderError, match="batches API not available"):
+            await adapter.submit_batch([{"messages": []}])
+
+    @pytest.mark.asyncio
+    async def test_submit_error_status(self, adapter):
+        """Other error statuses raise ProviderError with the status."""
+        adapter.session = FakeSession([FakeResponse(400, {"error": "bad"})])
+        with pytest.raises(ProviderError) as excinfo:
+            await adapter.submit_batch([{"messages": []}])
+        assert excinfo.value.status == 400
+
+    @pytest.mark.asyncio
+    async def test_get_batch(self, adapter):
+        """get_batch returns the batch object, or None for an unknown ID."""
+        adapter.session = FakeSession([FakeResponse(200, {"id": "batch-1", "status": "completed"}), FakeResponse(404)])
+
+        assert await adapter.get_batch("batch-1") == {"id": "batch-1", "status": "completed"}
+        assert await adapter.get_batch("missing") is None
+        (method, url, _, _), (_, missing_url, _, _) = adapter.session.requests
+        assert method == "GET"
+        assert url.path == "/openai/batches/batch-1"
+        assert missing_url.path == "/openai/batches/missing"
+
+
+class TestSessionRegistry:
+    """Test reference counting of the sessions shared between adapters."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def clean_registry(self):
+        yield
+        await adapters.close_shared_sessions()
+        await adapters.close_default_connector()
+
+    @pytest.mark.asyncio
+    async def test_same_host_shares_session(self):
+        """Adapters for the same host and timeout attach to one session."""
+        first, second = LMStudioAdapter("http://localhost:1234"), LMStudioAdapter("http://localhost:1234/v1")
+        other = LMStudioAdapter("http://localhost:4321")
+        for adapter in (first, second, other):
+            await adapter._ensure_session()
+
+        assert first.session is second.session
+        assert other.session is not first.session
+        assert adapters._SESSION_REFS[first._session_key] == 2
+        assert adapters._SESSION_REFS[other._session_key] == 1
+
+    @pytest.mark.asyncio
+    async def test_last_reference_closes_session(self):
+        """The shared session stays open until its last adapter closes."""
+        first, second = LMStudioAdapter(), LMStudioAdapter()
+        await first._ensure_session()
+        await second._ensure_session()
+        session, key = first.session, first._session_key
+
+        await first.close()
+        assert first.session is None
+        assert not session.closed
+        assert adapters._SESSION_REFS[key] == 1
+
+        await second.close()
+        assert session.closed
+        assert key not in adapters._SESSIONS
+        assert key not in adapters._SESSION_REFS
+
+    @pytest.mark.asyncio
+    async def test_reattach_after_close(self):
+        """A closed adapter attaches to a fresh session on its next call."""
+        adapter = LMStudioAdapter()
+        await adapter._ensure_session()
+        old = adapter.session
+        await adapter.close()
+
+        await adapter._ensure_session()
+        assert adapter.session is not old
+        assert not adapter.session.closed
+        assert adapters._SESSIONS[adapter._session_key] is adapter.session
+        assert adapters._SESSION_REFS[adapter._session_key] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_close_keeps_other_reference(self):
+        """Closing the same adapter twice releases only one reference."""
+        first, second = LMStudioAdapter(), LMStudioAdapter()
+        await first._ensure_session()
+        await second._ensure_session()
+
+        await first.close()
+        await first.close()
+        assert not second.session.closed
+        assert adapters._SESSION_REFS[second._session_key] == 1
+
+
+class TestRetries:
+    """Test Retry-After handling and retries in ProviderAdapter._post_json."""
+
+    @pytest.fixture
+    def adapter(self, monkeypatch):
+        """An adapter with deterministic retry delays."""
+        monkeypatch.setattr("prototype.adapters.random.uniform", lambda a, b: 0.0)
+        return LMStudioAdapter(max_retries=2, retry_delay=0.25)
+
+    @pytest.fixture
+    def responses(self, monkeypatch):
+        """Queue of (status, headers, body) replies served instead of the network."""
+        replies = []
+        sent = []
+
+        async def send(self, url, data, headers):
+            sent.append(data)
+            return replies.pop(0)
+
+        monkeypatch.setattr(LMStudioAdapter, "_send_aiohttp", send)
+        return replies, sent
+
+    @pytest.fixture
+    def delays(self, monkeypatch):
+        """Delays chosen by _retry_delay, which then lets the retry run immediately."""
+        chosen = []
+        retry_delay = LMStudioAdapter._retry_delay
+
+        def record(self, attempt, retry_after):
+            chosen.append(retry_delay(self, attempt, retry_after))
+            return 0.0
+
+        monkeypatch.setattr(LMStudioAdapter, "_retry_delay", record)
+        return chosen
+
+    def test_backs_off_exponentially_without_retry_after(self, adapter):
+        """Missing or unparseable Retry-After doubles the delay per attempt."""
+        base = adapter.retry_delay
+        assert adapter._retry_delay(0, None) == base
+        assert adapter._retry_delay(2, None) == base * 4
+        assert adapter._retry_delay(1, "soon") == base * 2
+
+    def test_defaults_to_class_policy(self):
+        """Without arguments an adapter uses MAX_RETRIES and RETRY_BASE_DELAY."""
+        adapter = LMStudioAdapter()
+        assert adapter.max_retries == LMStudioAdapter.MAX_RETRIES
+        assert adapter.retry_delay == LMStudioAdapter.RETRY_BASE_DELAY
+
+    def test_honors_retry_after_seconds(self, adapter):
+        """A delta-seconds Retry-After is used as given."""
+        assert adapter._retry_delay(0, "3") == 3.0
+
+    def test_honors_retry_after_http_date(self, adapter):
+        """An HTTP-date Retry-After waits until that time."""
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=5), usegmt=True)
+        assert 3.5 < adapter._retry_delay(0, when) <= 5.0
+
+    def test_clamps_retry_after(self, adapter):
+        """Retry-After is capped at RETRY_MAX_DELAY and never negative."""
+        assert adapter._retry_delay(0, "3600") == adapter.RETRY_MAX_DELAY
+        assert adapter._retry_delay(0, "-5") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self, adapter, responses, delays):
+        """Retryable statuses are retried and the Retry-After header is passed on."""
+        replies, sent = responses
+        replies.extend([
+            (503, {}, b"busy"),
+            (429, {"Retry-After": "2"}, b"slow down"),
+            (200, {}, b'{"ok": true}'),
+        ])
+        result = await adapter._post_json(URL("http://test/v1/chat/completions"), {"n": 1}, {})
+
+        assert result == {"ok": True}
+        assert len(sent) == 3
+        assert delays == [adapter.retry_delay, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, adapter, responses, delays):
+        """A 429 that persists past MAX_RETRIES raises RateLimitError."""
+        replies, sent = responses
+        replies.extend([(429, {}, b"")] * (adapter.max_retries + 1))
+        with pytest.raises(RateLimitError):
+            await adapter._post_json(URL("http://test/v1/chat/completions"), {}, {})
+        assert len(sent) == adapter.max_retries + 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, adapter, responses, delays):
+        """A 400 fails immediately with the upstream status."""
+        replies, sent = responses
+        replies.append((400, {}, b"bad request"))
+        with pytest.raises(ProviderError) as excinfo:
+            await adapter._post_json(URL("http://test/v1/chat/completions"), {}, {})
+        assert excinfo.value.status == 400
+        assert len(sent) == 1
+        assert delays == []
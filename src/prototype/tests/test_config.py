@@ -0,0 +1,63 @@
+"""Tests for the prototype configuration."""
+
+import pytest
+
+
+class TestProviderValidation:
+    """Test that provider updates only re-validate the provider they touch."""
+
+    def test_validates_only_the_named_provider(self, router_config):
+        """A broken Azure section does not block validating LM Studio."""
+        router_config.azure_enabled = True
+        router_config._validate_provider("lmstudio")
+
+        with pytest.raises(ValueError, match="AZURE_ENDPOINT"):
+            router_config._validate_provider("azure")
+
+    def test_update_rejects_invalid_value(self, router_config):
+        """An update that breaks the provider's own settings is rejected."""
+        with pytest.raises(ValueError):
+            router_config.update_provider_config("lmstudio", {"timeout": -1})
+
+    def test_update_checks_global_invariants(self, router_config):
+        """Disabling the last usable provider is rejected whichever one it is."""
+        router_config.update_provider_config("lmstudio", {"enabled": False})
+
+        with pytest.raises(ValueError, match="No providers"):
+            router_config.update_provider_config("openrouter", {"enabled": False})
+
+    def test_unknown_provider(self, router_config):
+        """Unknown provider types raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown provider type"):
+            router_config.update_provider_config("bedrock", {})
+
+
+class TestViews:
+    """Test the dict views built from a Config."""
+
+    def test_views_follow_updates(self, router_config):
+        """Provider and dict views reflect an accepted update."""
+        assert router_config.get_provider_config("lmstudio")["timeout"] == 30
+        router_config.update_provider_config("lmstudio", {"timeout": 45})
+
+        assert router_config.get_provider_config("lmstudio")["timeout"] == 45
+        assert router_config.to_dict()["lm_studio"]["timeout"] == 45
+
+    def test_views_follow_direct_assignment(self, router_config):
+        """Assigning a field directly is reflected too; Config is a plain dataclass."""
+        router_config.to_dict()
+        router_config.get_provider_config("lmstudio")
+        router_config.local_timeout = 99
+
+        assert router_config.to_dict()["lm_studio"]["timeout"] == 99
+        assert router_config.get_provider_config("lmstudio")["timeout"] == 99
+
+
+class TestGlobalValidation:
+    """Test validation of the service-wide settings."""
+
+    def test_rejects_unknown_overflow_backend(self, router_config):
+        """Only the aiohttp and httpx backends are accepted."""
+        router_config.overflow_backend = "curl"
+        with pytest.raises(ValueError, match="Overflow backend"):
+            router_config._validate_configuration()
@@ -0,0 +1,68 @@
+"""Tests for the prototype HTTP endpoints."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from prototype import main
+from prototype.router import ProviderType
+
+
+class SlowAdapter:
+    """Adapter stand-in that answers after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def chat_completion(self, request_data):
+        await asyncio.sleep(self.delay)
+        return {"id": "x", "choices": []}
+
+    async def chat_completion_stream(self, request_data):
+        await asyncio.sleep(self.delay)
+        yield {"choices": []}
+
+
+@pytest.fixture
+def client(make_router):
+    """HTTP client for the app, backed by a router with a fake local provider."""
+    router = make_router({ProviderType.LOCAL: SlowAdapter()}, request_timeout=0.1)
+    main.app.state.router = router
+    main.app.state.gate = asyncio.Semaphore(1)
+    transport = httpx.ASGITransport(app=main.app)
+    yield httpx.AsyncClient(transport=transport, base_url="http://test")
+    main.app.state.router = None
+    main.app.state.gate = None
+
+
+class TestChatCompletions:
+    """Test the concurrency gate and deadline on /v1/chat/completions."""
+
+    @pytest.mark.asyncio
+    async def test_request_succeeds(self, client):
+        """A request with a free gate slot is routed."""
+        async with client:
+            response = await client.post("/v1/chat/completions", json={"messages": []})
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_waiting_for_the_gate_counts_toward_timeout(self, client, stream):
+        """A request queued behind a full gate times out with 504."""
+        async with main.app.state.gate, client:
+            response = await client.post("/v1/chat/completions", json={"messages": [], "stream": stream})
+        assert response.status_code == 504
+
+
+class TestHealth:
+    """Test /health, served from the router's background snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_serves_snapshot_from_creation(self, client):
+        """The snapshot exists before the health loop's first refresh."""
+        async with client:
+            response = await client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["providers"]["local"]["status"] == "healthy"
+        assert response.content == main.app.state.router.health_snapshot
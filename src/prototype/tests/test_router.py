@@ -0,0 +1,357 @@
+"""Tests for the prototype routing engine."""
+
+import asyncio
+
+import pytest
+
+from prototype.router import ProviderStatus, ProviderType, SwarmRouter
+
+
+LOCAL = ProviderType.LOCAL
+OPENROUTER = ProviderType.OPENROUTER
+
+
+class FakeAdapter:
+    """Adapter stand-in that answers (or fails) after a fixed delay."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+        self.closed = False
+        self.warmed = False
+
+    async def chat_completion(self, request_data):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.closed:
+            raise RuntimeError(f"{self.name} closed mid-request")
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        return {"by": self.name}
+
+    async def warmup(self):
+        self.warmed = True
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeStreamAdapter:
+    """Adapter stand-in that streams chunks with controlled delays."""
+
+    def __init__(self, first_chunk_delay: float = 0.0, chunk_delay: float = 0.0, chunks: int = 3):
+        self.first_chunk_delay = first_chunk_delay
+        self.chunk_delay = chunk_delay
+        self.chunks = chunks
+
+    async def chat_completion_stream(self, request_data):
+        await asyncio.sleep(self.first_chunk_delay)
+        for n in range(self.chunks):
+            if n:
+                await asyncio.sleep(self.chunk_delay)
+            yield {"n": n}
+
+
+class FailingStreamAdapter:
+    """Adapter stand-in whose stream fails after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def chat_completion_stream(self, request_data):
+        await asyncio.sleep(self.delay)
+        raise RuntimeError("stream down")
+        yield  # pragma: no cover - makes this an async generator
+
+
+async def collect(stream):
+    return [frame async for frame in stream]
+
+
+class TestStreamChatCompletion:
+    """Test provider failover and latency accounting for streams."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_time_to_first_chunk(self, make_router):
+        """A long stream records its first-chunk latency, not its duration."""
+        router = make_router({LOCAL: FakeStreamAdapter(first_chunk_delay=0.02, chunk_delay=0.1)})
+        frames = await collect(router.stream_chat_completion({}))
+
+        assert frames[-1] == b"data: [DONE]\n\n"
+        stats = router.provider_stats[LOCAL]
+        assert stats["requests"] == 1
+        assert 20_000 <= stats["avg_response_time_us"] < 100_000
+
+    @pytest.mark.asyncio
+    async def test_failover_times_each_attempt(self, make_router):
+        """The fallback provider's latency excludes the failed attempt."""
+        router = make_router({
+            LOCAL: FailingStreamAdapter(delay=0.1),
+            OPENROUTER: FakeStreamAdapter(first_chunk_delay=0.01),
+        })
+        frames = await collect(router.stream_chat_completion({}))
+
+        assert len(frames) == 4
+        assert router.provider_stats[LOCAL]["errors"] == 1
+        assert router.provider_stats[OPENROUTER]["avg_response_time_us"] < 100_000
+        assert all(stats["in_flight"] == 0 for stats in router.provider_stats.values())
+
+
+class TestHedging:
+    """Test hedged requests in route_chat_completion."""
+
+    @pytest.fixture
+    def hedged_router(self, make_router):
+        """Router whose local provider has a 20ms latency history and hedges at 2x."""
+
+        def build(local, overflow):
+            router = make_router({LOCAL: local, OPENROUTER: overflow}, hedge_multiplier=2.0)
+            router._update_provider_stats(LOCAL, 0.02, success=True)
+            return router
+
+        return build
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_loser_is_cancelled(self, hedged_router):
+        """A slow primary is hedged; the faster hedge wins and the primary is cancelled."""
+        local = FakeAdapter("local", delay=1.0)
+        overflow = FakeAdapter("openrouter", delay=0.01)
+        router = hedged_router(local, overflow)
+
+        assert await router.route_chat_completion({}) == {"by": "openrouter"}
+        await asyncio.sleep(0)
+        assert local.cancelled == 1
+        assert all(stats["in_flight"] == 0 for stats in router.provider_stats.values())
+
+    @pytest.mark.asyncio
+    async def test_in_flight_counts_both_attempts(self, hedged_router):
+        """While hedged, both providers count the request as in flight."""
+        local = FakeAdapter("local", delay=0.2)
+        overflow = FakeAdapter("openrouter", delay=0.2)
+        router = hedged_router(local, overflow)
+
+        task = asyncio.create_task(router.route_chat_completion({}))
+        await asyncio.sleep(0.1)
+        assert router.provider_stats[LOCAL]["in_flight"] == 1
+        assert router.provider_stats[OPENROUTER]["in_flight"] == 1
+
+        assert await task == {"by": "local"}
+        await asyncio.sleep(0)
+        assert all(stats["in_flight"] == 0 for stats in router.provider_stats.values())
+
+    @pytest.mark.asyncio
+    async def test_both_attempts_failing_raises(self, hedged_router):
+        """When the primary and its hedge both fail, the request fails."""
+        local = FakeAdapter("local", delay=0.1, fail=True)
+        overflow = FakeAdapter("openrouter", delay=0.05, fail=True)
+        router = hedged_router(local, overflow)
+
+        with pytest.raises(Exception, match="All providers unavailable"):
+            await router.route_chat_completion({})
+        assert local.calls == overflow.calls == 1
+        assert router.provider_stats[LOCAL]["errors"] == 1
+        assert router.provider_stats[OPENROUTER]["errors"] == 1
+        assert all(stats["in_flight"] == 0 for stats in router.provider_stats.values())
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self, make_router):
+        """A provider with no EWMA yet is waited on rather than hedged."""
+        local = FakeAdapter("local", delay=0.1)
+        overflow = FakeAdapter("openrouter")
+        router = make_router({LOCAL: local, OPENROUTER: overflow}, hedge_multiplier=0.01)
+
+        assert await router.route_chat_completion({}) == {"by": "local"}
+        assert overflow.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_still_fails_over(self, hedged_router):
+        """A fast failure moves on to the next provider without waiting to hedge."""
+        local = FakeAdapter("local", fail=True)
+        overflow = FakeAdapter("openrouter")
+        router = hedged_router(local, overflow)
+
+        assert await router.route_chat_completion({}) == {"by": "openrouter"}
+
+
+
+class TestOutcomeWindow:
+    """Test provider status derived from the recent outcome window."""
+
+    @pytest.fixture
+    def router(self, make_router):
+        return make_router({LOCAL: FakeAdapter("local")})
+
+    def record(self, router, outcomes):
+        for success in outcomes:
+            router._update_provider_stats(LOCAL, 0.01, success=success)
+
+    @pytest.mark.parametrize("successes, status", [
+        (10, ProviderStatus.HEALTHY),
+        (8, ProviderStatus.HEALTHY),
+        (7, ProviderStatus.DEGRADED),
+        (5, ProviderStatus.DEGRADED),
+        (4, ProviderStatus.UNAVAILABLE),
+    ])
+    def test_status_thresholds(self, router, successes, status):
+        """Status is HEALTHY at 80% success, DEGRADED at 50%, else UNAVAILABLE."""
+        self.record(router, [True] * successes + [False] * (10 - successes))
+        assert router.provider_stats[LOCAL]["status"] is status
+
+    def test_few_failures_do_not_make_a_provider_unavailable(self, router):
+        """Below MIN_OUTCOMES attempts a failing provider is only DEGRADED."""
+        self.record(router, [False] * (router.MIN_OUTCOMES - 1))
+        assert router.provider_stats[LOCAL]["status"] is ProviderStatus.DEGRADED
+
+        self.record(router, [False])
+        assert router.provider_stats[LOCAL]["status"] is ProviderStatus.UNAVAILABLE
+
+    def test_status_change_invalidates_routing_order(self, router):
+        """Only a status transition marks the cached routing order dirty."""
+        router._get_routing_order({})
+        self.record(router, [True])
+        assert not router._order_dirty
+
+        self.record(router, [False])
+        assert router._order_dirty
+
+
+class TestRecovery:
+    """Test that an UNAVAILABLE provider finds its way back into routing."""
+
+    @pytest.mark.asyncio
+    async def test_local_recovers_through_trial_request(self, make_router):
+        """After failing out, LM Studio gets a trial request and rejoins routing."""
+        local = FakeAdapter("local", fail=True)
+        router = make_router({LOCAL: local, OPENROUTER: FakeAdapter("openrouter")})
+        router.TRIAL_INTERVAL_SECONDS = 0.05
+
+        for _ in range(router.MIN_OUTCOMES):
+            assert await router.route_chat_completion({}) == {"by": "openrouter"}
+        assert router.provider_stats[LOCAL]["status"] is ProviderStatus.UNAVAILABLE
+        assert router._get_routing_order({}) == [OPENROUTER]
+
+        local.fail = False
+        await asyncio.sleep(0.06)
+        assert await router.route_chat_completion({}) == {"by": "local"}
+        assert router.provider_stats[LOCAL]["status"] is ProviderStatus.HEALTHY
+        assert router._get_routing_order({}) == [LOCAL, OPENROUTER]
+
+    @pytest.mark.asyncio
+    async def test_one_trial_per_interval(self, make_router):
+        """A still-failing provider is tried once per interval, not on every request."""
+        local = FakeAdapter("local", fail=True)
+        router = make_router({LOCAL: local, OPENROUTER: FakeAdapter("openrouter")})
+        router.TRIAL_INTERVAL_SECONDS = 0.05
+
+        for _ in range(router.MIN_OUTCOMES):
+            await router.route_chat_completion({})
+        calls = local.calls
+
+        await asyncio.sleep(0.06)
+        for _ in range(3):
+            assert await router.route_chat_completion({}) == {"by": "openrouter"}
+        assert local.calls == calls + 1
+        assert router.provider_stats[LOCAL]["status"] is ProviderStatus.UNAVAILABLE
+
+
+class TestReplaceProvider:
+    """Test swapping a provider's adapter while requests are running on it."""
+
+    @pytest.mark.asyncio
+    async def test_idle_adapter_is_closed_immediately(self, make_router):
+        """An adapter with no calls in progress is closed during the swap."""
+        old = FakeAdapter("old")
+        router = make_router({OPENROUTER: old})
+
+        await router._replace_provider(OPENROUTER, FakeAdapter("new"))
+        assert old.closed
+
+    @pytest.mark.asyncio
+    async def test_in_flight_request_finishes_on_old_adapter(self, make_router):
+        """The old adapter stays open until its request completes, then closes."""
+        old = FakeAdapter("old", delay=0.05)
+        new = FakeAdapter("new")
+        router = make_router({OPENROUTER: old}, lm_studio_enabled=False)
+
+        request = asyncio.create_task(router.route_chat_completion({}))
+        await asyncio.sleep(0.01)
+        await router._replace_provider(OPENROUTER, new)
+        assert not old.closed
+
+        assert await request == {"by": "old"}
+        await asyncio.sleep(0)
+        assert old.closed
+        assert not new.closed
+
+    @pytest.mark.asyncio
+    async def test_old_adapter_outcomes_do_not_count_against_new(self, make_router):
+        """A failure on the replaced adapter leaves the new adapter's stats clean."""
+        old = FakeAdapter("old", delay=0.05, fail=True)
+        router = make_router({OPENROUTER: old}, lm_studio_enabled=False)
+
+        request = asyncio.create_task(router.route_chat_completion({}))
+        await asyncio.sleep(0.01)
+        await router._replace_provider(OPENROUTER, FakeAdapter("new"))
+        with pytest.raises(Exception, match="old down"):
+            await request
+
+        stats = router.provider_stats[OPENROUTER]
+        assert stats["errors"] == 0
+        assert stats["status"] is ProviderStatus.HEALTHY
+        assert stats["in_flight"] == 0
+        assert router._get_routing_order({}) == [OPENROUTER]
+
+    @pytest.mark.asyncio
+    async def test_close_closes_retired_adapters(self, make_router):
+        """Shutting the router down also closes adapters still draining."""
+        old = FakeAdapter("old", delay=1.0)
+        router = make_router({OPENROUTER: old}, lm_studio_enabled=False)
+
+        request = asyncio.create_task(router.route_chat_completion({}))
+        await asyncio.sleep(0.01)
+        await router._replace_provider(OPENROUTER, FakeAdapter("new"))
+        await router.close()
+        assert old.closed
+
+        request.cancel()
+        await asyncio.gather(request, return_exceptions=True)
+
+
+class TestProviderSetup:
+    """Test that router settings reach the adapters it builds."""
+
+    def test_retry_policy_comes_from_config(self, router_config):
+        """SWARMROUTER_MAX_RETRIES/RETRY_DELAY configure every adapter."""
+        router_config.max_retries = 1
+        router_config.retry_delay = 2.5
+        router = SwarmRouter(router_config)
+
+        for provider in router.providers.values():
+            assert provider.max_retries == 1
+            assert provider.retry_delay == 2.5
+
+    @pytest.mark.asyncio
+    async def test_health_monitor_warms_providers(self, make_router):
+        """Starting the monitor pre-opens connections to every provider once."""
+        local, overflow = FakeAdapter("local"), FakeAdapter("openrouter")
+        router = make_router({LOCAL: local, OPENROUTER: overflow})
+
+        router.start_health_monitor()
+        await asyncio.sleep(0)
+        assert local.warmed and overflow.warmed
+        await router.close()
+
+    def test_overflow_backend_comes_from_config(self, router_config):
+        """SWARMROUTER_OVERFLOW_BACKEND selects the overflow providers' HTTP client."""
+        router_config.overflow_backend = "httpx"
+        router = SwarmRouter(router_config)
+
+        assert router.providers[OPENROUTER].backend == "httpx"
+        assert router.providers[LOCAL].backend == "aiohttp"
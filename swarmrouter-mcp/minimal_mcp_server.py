@@ -17,6 +17,7 @@ import sys
 import os
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -29,6 +30,13 @@ except ImportError:
     HAS_ANTHROPIC = False
     print("Warning: anthropic package not installed. AI routing will use simulated responses.")
 
+# orjson is an optional fast path for the stdout protocol; json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Configure logging to stderr so stdout is clean for MCP communication
 logging.basicConfig(
     level=logging.INFO,
@@ -73,6 +81,11 @@ class BeeAgent:
     similar to how real bees carry information about food sources.
     """
     
+    # Bees are created in bulk per task and never grow new attributes,
+    # so slots keep them small and skip the per-instance __dict__.
+    __slots__ = ("bee_id", "dance_type", "assigned_task", "estimated_tokens",
+                 "actual_tokens", "model", "result", "status")
+    
     def __init__(self, bee_id: str, dance_type: DanceType, task: str, 
                  estimated_tokens: int, model: str = "claude-3-haiku-20240307"):
         self.bee_id = bee_id
@@ -105,6 +118,9 @@ class SwarmTask:
     Tasks are delegated to bees based on their dance type and complexity.
     """
     
+    __slots__ = ("task_id", "description", "complexity", "dance_type",
+                 "max_tokens", "created_ns", "bees", "status")
+    
     def __init__(self, task_id: str, description: str, complexity: TaskComplexity,
                  dance_type: DanceType, max_tokens: int = 10000):
         self.task_id = task_id
@@ -112,10 +128,15 @@ class SwarmTask:
         self.complexity = complexity
         self.dance_type = dance_type
         self.max_tokens = max_tokens
-        self.created_at = datetime.now()
+        self.created_ns = time.time_ns()
         self.bees: List[BeeAgent] = []
         self.status = "pending"
         
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime, built only when someone asks for it."""
+        return datetime.fromtimestamp(self.created_ns / 1e9)
+        
     def add_bee(self, bee: BeeAgent):
         """Add a bee to this task."""
         self.bees.append(bee)
@@ -340,8 +361,10 @@ Assigned model: {bee.model}
 Please provide a focused response for your specific part of the larger task.
 Be concise but thorough, staying within approximately {bee.estimated_tokens} tokens."""
 
-                # Make API call to Claude
-                message = self.anthropic_client.messages.create(
+                # Make API call to Claude off the event loop so sibling
+                # bees can run concurrently
+                message = await asyncio.to_thread(
+                    self.anthropic_client.messages.create,
                     model=bee.model,
                     max_tokens=bee.estimated_tokens,
                     messages=[{"role": "user", "content": prompt}]
@@ -398,9 +421,8 @@ Be concise but thorough, staying within approximately {bee.estimated_tokens} tok
         
         logger.info(f"Delegated task {task_id}: {complexity.value} complexity, {dance_type.value} dance")
         
-        # Execute bee tasks (for demonstration, execute sequentially)
-        for bee in bees:
-            await self.execute_bee_task(bee)
+        # Execute bee tasks concurrently, like foragers heading out together
+        await asyncio.gather(*(self.execute_bee_task(bee) for bee in bees))
             
         task.status = "completed"
         return task
@@ -419,6 +441,14 @@ class MCPServer:
         
     def write_message(self, message: Dict[str, Any]):
         """Write a JSON message to stdout for MCP communication."""
+        buffer = getattr(sys.stdout, "buffer", None)
+        if HAS_ORJSON and buffer is not None:
+            # orjson emits raw UTF-8, so bypass the text layer (whose encoding
+            # may not be UTF-8) and write the bytes directly
+            sys.stdout.flush()
+            buffer.write(orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE))
+            buffer.flush()
+            return
         json.dump(message, sys.stdout)
         sys.stdout.write('\n')
         sys.stdout.flush()
@@ -477,30 +507,29 @@ class MCPServer:
     async def handle_get_swarm_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle request for overall swarm statistics."""
         total_tasks = len(self.router.tasks)
-        completed_tasks = sum(1 for task in self.router.tasks.values() if task.status == "completed")
-        total_bees = sum(len(task.bees) for task in self.router.tasks.values())
+        completed_tasks = total_bees = 0
+        total_savings = 0.0
+        distribution: Dict[str, int] = {}
+        
+        # One pass over the tasks gathers every statistic at once
+        for task in self.router.tasks.values():
+            if task.status == "completed":
+                completed_tasks += 1
+            total_bees += len(task.bees)
+            total_savings += task.calculate_token_savings()
+            dance = task.dance_type.value
+            distribution[dance] = distribution.get(dance, 0) + 1
         
-        avg_savings = 0
-        if total_tasks > 0:
-            total_savings = sum(task.calculate_token_savings() for task in self.router.tasks.values())
-            avg_savings = total_savings / total_tasks
+        avg_savings = total_savings / total_tasks if total_tasks > 0 else 0
         
         return {
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
             "total_bees": total_bees,
             "average_token_savings": round(avg_savings, 2),
-            "dance_type_distribution": self._get_dance_distribution()
+            "dance_type_distribution": distribution
         }
     
-    def _get_dance_distribution(self) -> Dict[str, int]:
-        """Get distribution of dance types across all tasks."""
-        distribution = {}
-        for task in self.router.tasks.values():
-            dance = task.dance_type.value
-            distribution[dance] = distribution.get(dance, 0) + 1
-        return distribution
-    
     async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process an MCP request and return response."""
         method = request.get("method", "")
@@ -534,9 +563,23 @@ async def run_interactive_demo():
     This shows the bee/hive metaphor in action with example tasks
     of varying complexity.
     """
-    print("🐝 SwarmRouter Minimal MVP - Interactive Demo")
-    print("=" * 50)
-    print()
+    # Collect each section's lines and write them in one go rather than
+    # paying a locked stdout write per print()
+    out: List[str] = []
+    
+    def emit(line: str = "") -> None:
+        out.append(line)
+        out.append("\n")
+    
+    def flush() -> None:
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        out.clear()
+    
+    emit("🐝 SwarmRouter Minimal MVP - Interactive Demo")
+    emit("=" * 50)
+    emit()
+    flush()
     
     server = MCPServer()
     
@@ -570,9 +613,9 @@ async def run_interactive_demo():
     ]
     
     for i, demo_task in enumerate(demo_tasks, 1):
-        print(f"Demo {i}: {demo_task['description']}")
-        print(f"Expected: {demo_task['expected_complexity']} complexity, {demo_task['expected_dance']} dance")
-        print("-" * 50)
+        emit(f"Demo {i}: {demo_task['description']}")
+        emit(f"Expected: {demo_task['expected_complexity']} complexity, {demo_task['expected_dance']} dance")
+        emit("-" * 50)
         
         # Delegate the task
         request = {
@@ -588,16 +631,16 @@ async def run_interactive_demo():
         result = response.get("result", {})
         
         if "error" in result:
-            print(f"❌ Error: {result['error']}")
+            emit(f"❌ Error: {result['error']}")
         else:
-            print(f"✅ Task ID: {result['task_id']}")
-            print(f"🎭 Dance Type: {result['dance_type']}")
-            print(f"🧠 Complexity: {result['complexity']}")
-            print(f"🐝 Bees Assigned: {result['bee_count']}")
-            print(f"💰 Token Savings: {result['estimated_token_savings']:.1f}%")
-            print(f"📋 {result['message']}")
+            emit(f"✅ Task ID: {result['task_id']}")
+            emit(f"🎭 Dance Type: {result['dance_type']}")
+            emit(f"🧠 Complexity: {result['complexity']}")
+            emit(f"🐝 Bees Assigned: {result['bee_count']}")
+            emit(f"💰 Token Savings: {result['estimated_token_savings']:.1f}%")
+            emit(f"📋 {result['message']}")
         
-        print()
+        emit()
         
         # Show task details
         status_request = {
@@ -610,17 +653,18 @@ async def run_interactive_demo():
         status_result = status_response.get("result", {})
         
         if "bees" in status_result:
-            print("🐝 Bee Details:")
+            emit("🐝 Bee Details:")
             for bee in status_result["bees"]:
-                print(f"  • {bee['bee_id']}: {bee['assigned_task']}")
-                print(f"    Model: {bee['model']} | Status: {bee['status']}")
+                emit(f"  • {bee['bee_id']}: {bee['assigned_task']}")
+                emit(f"    Model: {bee['model']} | Status: {bee['status']}")
                 if bee['result']:
                     # Truncate long results for demo
                     result_preview = bee['result'][:100] + "..." if len(bee['result']) > 100 else bee['result']
-                    print(f"    Result: {result_preview}")
+                    emit(f"    Result: {result_preview}")
         
-        print("=" * 70)
-        print()
+        emit("=" * 70)
+        emit()
+        flush()
     
     # Show final swarm statistics
     stats_request = {
@@ -632,12 +676,13 @@ async def run_interactive_demo():
     stats_response = await server.process_request(stats_request)
     stats = stats_response.get("result", {})
     
-    print("📊 Final Swarm Statistics:")
-    print(f"Total Tasks: {stats.get('total_tasks', 0)}")
-    print(f"Completed Tasks: {stats.get('completed_tasks', 0)}")
-    print(f"Total Bees: {stats.get('total_bees', 0)}")
-    print(f"Average Token Savings: {stats.get('average_token_savings', 0)}%")
-    print(f"Dance Distribution: {stats.get('dance_type_distribution', {})}")
+    emit("📊 Final Swarm Statistics:")
+    emit(f"Total Tasks: {stats.get('total_tasks', 0)}")
+    emit(f"Completed Tasks: {stats.get('completed_tasks', 0)}")
+    emit(f"Total Bees: {stats.get('total_bees', 0)}")
+    emit(f"Average Token Savings: {stats.get('average_token_savings', 0)}%")
+    emit(f"Dance Distribution: {stats.get('dance_type_distribution', {})}")
+    flush()
 
 
 def main():
@@ -664,7 +709,7 @@ def main():
         # Implementation for MCP protocol would go here
         # For now, just show that it's ready
         server = MCPServer()
-        print(json.dumps({
+        server.write_message({
             "jsonrpc": "2.0",
             "result": {
                 "name": "SwarmRouter Minimal MVP",
@@ -672,7 +717,7 @@ def main():
                 "description": "Minimal implementation demonstrating SwarmRouter concepts"
             },
             "id": 1
-        }))
+        })
     else:
         # Run interactive demo
         asyncio.run(run_interactive_demo())
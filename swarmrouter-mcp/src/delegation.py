@@ -1,11 +1,42 @@
 """Task delegation logic for SwarmRouter MCP server."""
 
 import logging
-from typing import Dict, List, Optional
-from .models import DanceType, SwarmTask, BeeMetadata, TaskDelegationRequest, TaskStatus
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from .models import (
+    DanceType,
+    SwarmTask,
+    BeeMetadata,
+    TaskDelegationRequest,
+    TaskStatus,
+    validate_bees,
+)
 
 logger = logging.getLogger(__name__)
 
+# Constant lookup tables, built once at import instead of on every call
+_EFFICIENCY_MULTIPLIERS = {
+    DanceType.WAGGLE: 0.3,  # 70% savings - complex decomposition
+    DanceType.ROUND: 0.9,  # 10% savings - simple tasks
+    DanceType.SCOUT: 0.5,  # 50% savings - focused research
+    DanceType.TREMBLE: 0.7,  # 30% savings - error handling
+    DanceType.CONVERGE: 0.4,  # 60% savings - shared consensus
+    DanceType.DISPERSE: 0.25,  # 75% savings - parallel efficiency
+}
+
+# Statuses that count as "active" in swarm statistics
+_ACTIVE_STATUSES = frozenset({TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS})
+
+_BEE_SPECIALTIES = {
+    DanceType.WAGGLE: "architect",
+    DanceType.ROUND: "messenger",
+    DanceType.SCOUT: "explorer",
+    DanceType.TREMBLE: "debugger",
+    DanceType.CONVERGE: "facilitator",
+    DanceType.DISPERSE: "coordinator",
+}
+
 
 class TaskDelegator:
     """
@@ -15,8 +46,17 @@ class TaskDelegator:
     appropriate bees to handle the work.
     """
 
+    # How long a statistics snapshot may be served while nothing has changed.
+    # Bee token reports do not bump the generation, so this also bounds how
+    # stale average savings can get.
+    STATS_TTL_SECONDS = 0.05
+
     def __init__(self):
         self.tasks: Dict[str, SwarmTask] = {}
+        self._task_ids_by_status: Dict[TaskStatus, Set[str]] = defaultdict(set)
+        self._total_bees = 0
+        self._generation = 0
+        self._stats_cache: Optional[Tuple[int, float, Dict]] = None
         self.dance_keywords = {
             DanceType.WAGGLE: [
                 "complex",
@@ -121,16 +161,7 @@ class TaskDelegator:
         base_allocation = total_tokens // max(num_subtasks, 1)
 
         # Apply dance-specific efficiency multipliers
-        efficiency_multipliers = {
-            DanceType.WAGGLE: 0.3,  # 70% savings - complex decomposition
-            DanceType.ROUND: 0.9,  # 10% savings - simple tasks
-            DanceType.SCOUT: 0.5,  # 50% savings - focused research
-            DanceType.TREMBLE: 0.7,  # 30% savings - error handling
-            DanceType.CONVERGE: 0.4,  # 60% savings - shared consensus
-            DanceType.DISPERSE: 0.25,  # 75% savings - parallel efficiency
-        }
-
-        multiplier = efficiency_multipliers.get(dance_type, 0.5)
+        multiplier = _EFFICIENCY_MULTIPLIERS.get(dance_type, 0.5)
         return int(base_allocation * multiplier)
 
     def create_bees_for_task(
@@ -145,20 +176,25 @@ class TaskDelegator:
             # Generate default subtasks based on dance type
             subtasks = self.generate_default_subtasks(task.description, task.dance_type)
 
-        bees = []
         tokens_per_bee = self.estimate_tokens_per_bee(
             task.max_tokens, len(subtasks), task.dance_type
         )
-
-        for i, subtask in enumerate(subtasks):
-            bee = BeeMetadata(
-                dance_type=task.dance_type,
-                assigned_task=subtask,
-                estimated_tokens=tokens_per_bee,
-                specialty=self.get_bee_specialty(task.dance_type),
-            )
-            bees.append(bee)
-            logger.debug(f"Created {bee.bee_id} for subtask: {subtask}")
+        specialty = self.get_bee_specialty(task.dance_type)
+
+        # Validate the whole swarm in one pass through the cached adapter
+        bees = validate_bees(
+            [
+                {
+                    "dance_type": task.dance_type,
+                    "assigned_task": subtask,
+                    "estimated_tokens": tokens_per_bee,
+                    "specialty": specialty,
+                }
+                for subtask in subtasks
+            ]
+        )
+        for bee in bees:
+            logger.debug(f"Created {bee.bee_id} for subtask: {bee.assigned_task}")
 
         return bees
 
@@ -205,15 +241,7 @@ class TaskDelegator:
 
     def get_bee_specialty(self, dance_type: DanceType) -> str:
         """Map dance types to bee specialties."""
-        specialty_map = {
-            DanceType.WAGGLE: "architect",
-            DanceType.ROUND: "messenger",
-            DanceType.SCOUT: "explorer",
-            DanceType.TREMBLE: "debugger",
-            DanceType.CONVERGE: "facilitator",
-            DanceType.DISPERSE: "coordinator",
-        }
-        return specialty_map.get(dance_type, "generalist")
+        return _BEE_SPECIALTIES.get(dance_type, "generalist")
 
     def delegate_task(self, request: TaskDelegationRequest) -> SwarmTask:
         """
@@ -240,8 +268,12 @@ class TaskDelegator:
         for bee in bees:
             task.assign_bee(bee)
 
-        # Store task
+        # Store task and keep the status counters in step with it
         self.tasks[task.task_id] = task
+        self._task_ids_by_status[task.status].add(task.task_id)
+        self._total_bees += len(bees)
+        self._generation += 1
+        task.watch(self._on_task_change)
 
         logger.info(
             f"Delegated task {task.task_id} with {len(bees)} bees "
@@ -250,12 +282,38 @@ class TaskDelegator:
 
         return task
 
+    def _on_task_change(
+        self, task: SwarmTask, previous: TaskStatus, new_bees: int
+    ) -> None:
+        """Move a task between status buckets after a state transition."""
+        self._generation += 1
+        self._total_bees += new_bees
+        if task.status != previous:
+            self._task_ids_by_status[previous].discard(task.task_id)
+            self._task_ids_by_status[task.status].add(task.task_id)
+
     def get_task_status(self, task_id: str) -> Optional[SwarmTask]:
         """Get the current status of a task."""
         return self.tasks.get(task_id)
 
     def get_swarm_statistics(self) -> Dict:
-        """Get overall swarm performance statistics."""
+        """
+        Get overall swarm performance statistics.
+
+        Back-to-back polls with no task changes in between are served from
+        a short-lived snapshot.
+        """
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached and cached[0] == self._generation and now < cached[1]:
+            return dict(cached[2])
+
+        stats = self._compute_swarm_statistics()
+        self._stats_cache = (self._generation, now + self.STATS_TTL_SECONDS, stats)
+        return dict(stats)
+
+    def _compute_swarm_statistics(self) -> Dict:
+        """Build the statistics dict from the running counters."""
         if not self.tasks:
             return {
                 "total_tasks": 0,
@@ -265,26 +323,24 @@ class TaskDelegator:
                 "total_bees_deployed": 0,
             }
 
-        active_tasks = [
-            t
-            for t in self.tasks.values()
-            if t.status in [TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS]
-        ]
-        completed_tasks = [
-            t for t in self.tasks.values() if t.status == TaskStatus.COMPLETED
-        ]
+        by_status = self._task_ids_by_status
+        active_tasks = sum(len(by_status[status]) for status in _ACTIVE_STATUSES)
+        completed_ids = by_status[TaskStatus.COMPLETED]
 
+        # Savings still depend on each bee's reported tokens, which can be
+        # filled in after completion, so only that part walks the tasks.
         avg_savings = 0
-        if completed_tasks:
-            savings = [t.calculate_token_savings() for t in completed_tasks]
-            avg_savings = sum(savings) / len(savings)
+        if completed_ids:
+            total_savings = sum(
+                self.tasks[task_id].calculate_token_savings()
+                for task_id in completed_ids
+            )
+            avg_savings = total_savings / len(completed_ids)
 
         return {
             "total_tasks": len(self.tasks),
-            "active_tasks": len(active_tasks),
-            "completed_tasks": len(completed_tasks),
+            "active_tasks": active_tasks,
+            "completed_tasks": len(completed_ids),
             "average_token_savings": round(avg_savings, 2),
-            "total_bees_deployed": sum(
-                len(t.assigned_bees) for t in self.tasks.values()
-            ),
+            "total_bees_deployed": self._total_bees,
         }
@@ -1,10 +1,47 @@
 """Data models for SwarmRouter MCP server using the bee/hive metaphor."""
 
+from base64 import urlsafe_b64encode
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
-import uuid
+from typing import Callable, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+import os
+
+
+class _IDGen:
+    """
+    Hands out random hex ids sliced from a pooled urandom buffer.
+
+    Bees and tasks are created in bursts, so one os.urandom call is shared
+    across many ids instead of paying for a uuid4() per object.
+    """
+
+    __slots__ = ("_buf", "_off")
+
+    _POOL_SIZE = 4096
+
+    def __init__(self):
+        self._buf = b""
+        self._off = 0
+
+    def _take(self, n: int) -> bytes:
+        if self._off + n > len(self._buf):
+            self._buf = os.urandom(self._POOL_SIZE)
+            self._off = 0
+        start = self._off
+        self._off = start + n
+        return self._buf[start : self._off]
+
+    def next_hex(self, n: int = 8) -> str:
+        """Return ``n`` random bytes as a hex string (``2 * n`` chars)."""
+        return self._take(n).hex()
+
+    def next_token(self, n: int = 12) -> str:
+        """Return ``n`` random bytes as URL-safe base64 (``n`` divisible by 3)."""
+        return urlsafe_b64encode(self._take(n)).decode("ascii")
+
+
+_idgen = _IDGen()
 
 
 class DanceType(str, Enum):
@@ -55,7 +92,14 @@ class BeeMetadata(BaseModel):
     similar to how real bees carry information about food sources.
     """
 
-    bee_id: str = Field(default_factory=lambda: f"bee_{uuid.uuid4().hex[:8]}")
+    # Bees are mutated by the delegator after validation (e.g. actual_tokens);
+    # keep those writes as plain attribute sets. The field set is closed, so
+    # unknown keys are rejected rather than silently dropped.
+    model_config = ConfigDict(
+        validate_assignment=False, extra="forbid", revalidate_instances="never"
+    )
+
+    bee_id: str = Field(default_factory=lambda: f"bee_{_idgen.next_hex(4)}")
     dance_type: DanceType
     assigned_task: Optional[str] = None
     estimated_tokens: int = Field(gt=0)
@@ -77,7 +121,11 @@ class SwarmTask(BaseModel):
     of the work required.
     """
 
-    task_id: str = Field(default_factory=lambda: f"task_{uuid.uuid4().hex}")
+    model_config = ConfigDict(
+        validate_assignment=False, extra="forbid", revalidate_instances="never"
+    )
+
+    task_id: str = Field(default_factory=lambda: f"task_{_idgen.next_token(12)}")
     description: str
     priority: TaskPriority = TaskPriority.MEDIUM
     dance_type: DanceType
@@ -89,23 +137,45 @@ class SwarmTask(BaseModel):
     result: Optional[str] = None
     error: Optional[str] = None
 
+    _listener: Optional["TaskListener"] = PrivateAttr(default=None)
+
+    def watch(self, listener: "TaskListener") -> None:
+        """
+        Register a callback for status changes and bee assignments.
+
+        The listener receives the task, its previous status and the number
+        of bees just assigned, which lets owners keep running counters
+        instead of rescanning every task.
+        """
+        self._listener = listener
+
+    def _notify(self, previous: TaskStatus, new_bees: int = 0) -> None:
+        if self._listener is not None:
+            self._listener(self, previous, new_bees)
+
     def assign_bee(self, bee: BeeMetadata) -> None:
         """Assign a bee to this task."""
+        previous = self.status
         self.assigned_bees.append(bee)
         if self.status == TaskStatus.PENDING:
             self.status = TaskStatus.ASSIGNED
+        self._notify(previous, 1)
 
     def mark_complete(self, result: str) -> None:
         """Mark task as completed with result."""
+        previous = self.status
         self.status = TaskStatus.COMPLETED
         self.completed_at = datetime.now()
         self.result = result
+        self._notify(previous)
 
     def mark_failed(self, error: str) -> None:
         """Mark task as failed with error."""
+        previous = self.status
         self.status = TaskStatus.FAILED
         self.completed_at = datetime.now()
         self.error = error
+        self._notify(previous)
 
     def calculate_token_savings(self) -> float:
         """Calculate estimated token savings from delegation."""
@@ -117,9 +187,14 @@ class SwarmTask(BaseModel):
         return (self.max_tokens - total_actual) / self.max_tokens * 100
 
 
+TaskListener = Callable[[SwarmTask, TaskStatus, int], None]
+
+
 class TaskDelegationRequest(BaseModel):
     """Request model for delegating a task."""
 
+    model_config = ConfigDict(extra="forbid")
+
     description: str = Field(..., min_length=1)
     priority: TaskPriority = TaskPriority.MEDIUM
     max_tokens: int = Field(default=10000, gt=0)
@@ -135,3 +210,29 @@ class TaskDelegationResponse(BaseModel):
     assigned_bees: int
     estimated_token_savings: float
     message: str
+
+    @classmethod
+    def from_trusted(cls, **data) -> "TaskDelegationResponse":
+        """
+        Build a response from server-side state without re-validating it.
+
+        Every field is copied from a SwarmTask that was validated when it was
+        created, so the schema walk is skipped. External input must still go
+        through the normal constructor.
+        """
+        return cls.model_construct(**data)
+
+
+# Shared adapter so bulk bee validation reuses one compiled validator and
+# iterates the list inside pydantic-core instead of per-element Python calls.
+_BEES_ADAPTER = TypeAdapter(List[BeeMetadata])
+
+
+def validate_bees(data: list) -> List[BeeMetadata]:
+    """Validate a list of bee payloads (dicts or BeeMetadata) in one call."""
+    return _BEES_ADAPTER.validate_python(data)
+
+
+def dump_bees(bees: List[BeeMetadata]) -> bytes:
+    """Serialize a list of bees straight to JSON bytes."""
+    return _BEES_ADAPTER.dump_json(bees)
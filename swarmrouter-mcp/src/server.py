@@ -86,8 +86,8 @@ async def delegate_task_impl(
         # Delegate to swarm
         task = delegator.delegate_task(request)
 
-        # Create response
-        response = TaskDelegationResponse(
+        # Create response; all fields come from the validated task
+        response = TaskDelegationResponse.from_trusted(
             task_id=task.task_id,
             dance_type=task.dance_type,
             assigned_bees=len(task.assigned_bees),
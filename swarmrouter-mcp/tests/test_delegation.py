@@ -1,7 +1,13 @@
 """Tests for task delegation logic."""
 
 import pytest
-from src.models import DanceType, TaskPriority, TaskStatus, TaskDelegationRequest
+from src.models import (
+    BeeMetadata,
+    DanceType,
+    TaskPriority,
+    TaskStatus,
+    TaskDelegationRequest,
+)
 from src.delegation import TaskDelegator
 
 
@@ -225,6 +231,33 @@ class TestTaskDelegator:
         assert stats["average_token_savings"] > 0
         assert stats["total_bees_deployed"] > 0
 
+    def test_swarm_statistics_track_transitions(self, delegator):
+        """Test that counters follow tasks through later state changes."""
+        tasks = [
+            delegator.delegate_task(TaskDelegationRequest(description=f"Task {i}"))
+            for i in range(3)
+        ]
+        bees_before = delegator.get_swarm_statistics()["total_bees_deployed"]
+
+        tasks[0].mark_complete("Done")
+        tasks[1].mark_failed("Timed out")
+        tasks[2].assign_bee(
+            BeeMetadata(dance_type=tasks[2].dance_type, estimated_tokens=100)
+        )
+
+        stats = delegator.get_swarm_statistics()
+        assert stats["active_tasks"] == 1
+        assert stats["completed_tasks"] == 1
+        assert stats["total_bees_deployed"] == bees_before + 1
+
+    def test_swarm_statistics_cache_invalidated_on_change(self, delegator):
+        """Test that cached statistics are dropped after a task changes."""
+        task = delegator.delegate_task(TaskDelegationRequest(description="Task"))
+
+        assert delegator.get_swarm_statistics()["completed_tasks"] == 0
+        task.mark_complete("Done")
+        assert delegator.get_swarm_statistics()["completed_tasks"] == 1
+
     def test_dance_type_override(self, delegator):
         """Test overriding automatic dance type detection."""
         request = TaskDelegationRequest(
@@ -10,6 +10,8 @@ from src.models import (
     SwarmTask,
     TaskDelegationRequest,
     TaskDelegationResponse,
+    validate_bees,
+    dump_bees,
 )
 
 
@@ -55,6 +57,17 @@ class TestBeeMetadata:
         assert bee.estimated_tokens == 1000
         assert bee.actual_tokens is None
 
+    def test_bee_ids_are_unique(self):
+        """Test that pooled bee ids keep their format and do not repeat."""
+        bees = [
+            BeeMetadata(dance_type=DanceType.DISPERSE, estimated_tokens=10)
+            for _ in range(1100)  # spans a pool refill
+        ]
+        ids = {bee.bee_id for bee in bees}
+
+        assert len(ids) == len(bees)
+        assert all(len(bee_id) == len("bee_") + 8 for bee_id in ids)
+
     def test_bee_efficiency_calculation(self):
         """Test token efficiency calculation."""
         bee = BeeMetadata(dance_type=DanceType.WAGGLE, estimated_tokens=1000)
@@ -75,6 +88,28 @@ class TestBeeMetadata:
         assert bee.calculate_efficiency() == -0.2  # 20% over
 
 
+class TestBulkBees:
+    """Test the bulk bee validation helpers."""
+
+    def test_validate_and_dump_bees(self):
+        """Test validating and serializing a list of bees at once."""
+        bees = validate_bees(
+            [
+                {"dance_type": "scout", "estimated_tokens": 100},
+                {"dance_type": "scout", "estimated_tokens": 200, "specialty": "explorer"},
+            ]
+        )
+
+        assert all(isinstance(bee, BeeMetadata) for bee in bees)
+        assert bees[1].specialty == "explorer"
+        assert b'"dance_type":"scout"' in dump_bees(bees)
+
+    def test_validate_bees_rejects_invalid(self):
+        """Test that bulk validation still enforces field constraints."""
+        with pytest.raises(ValueError):
+            validate_bees([{"dance_type": "scout", "estimated_tokens": 0}])
+
+
 class TestSwarmTask:
     """Test the SwarmTask model."""
 
@@ -88,6 +123,7 @@ class TestSwarmTask:
         )
 
         assert task.task_id.startswith("task_")
+        assert len(task.task_id) == len("task_") + 16
         assert task.description == "Build user authentication"
         assert task.priority == TaskPriority.HIGH
         assert task.dance_type == DanceType.WAGGLE
@@ -213,6 +249,21 @@ class TestTaskDelegationModels:
         assert response.estimated_token_savings == 73.5
         assert response.message == "Task delegated successfully"
 
+    def test_delegation_response_from_trusted(self):
+        """Test building a response from trusted server state."""
+        data = dict(
+            task_id="task_123",
+            dance_type=DanceType.SCOUT,
+            assigned_bees=3,
+            estimated_token_savings=50.0,
+            message="Task delegated successfully",
+        )
+
+        response = TaskDelegationResponse.from_trusted(**data)
+
+        assert response == TaskDelegationResponse(**data)
+        assert response.model_dump() == data
+
 
 class TestModelValidation:
     """Test model validation and error cases."""
@@ -246,3 +297,14 @@ class TestModelValidation:
         # Invalid: empty description
         with pytest.raises(ValueError):
             TaskDelegationRequest(description="")
+
+    def test_unknown_fields_rejected(self):
+        """Test models reject fields they do not declare."""
+        with pytest.raises(ValueError):
+            BeeMetadata(dance_type=DanceType.WAGGLE, estimated_tokens=100, color="gold")
+
+        with pytest.raises(ValueError):
+            SwarmTask(description="Task", dance_type=DanceType.ROUND, owner="me")
+
+        with pytest.raises(ValueError):
+            TaskDelegationRequest(description="Task", max_token=100)